@@ -1,6 +1,7 @@
 import math, random, sys, time
 import pygame
 from enum import Enum
+from functools import lru_cache
 
 # ---------------
 # CONFIG / COLORS
@@ -15,6 +16,7 @@ AIR_CONTROL = 0.7
 FRICTION = 0.88
 AIR_RESISTANCE = 0.96
 TERMINAL_VELOCITY = 18.0
+COLLISION_QUERY_MARGIN = 32  # Covers the furthest a player or stone moves in one physics step
 
 # Enhanced color palette
 COLOR_BG_TOP = (20, 24, 40)
@@ -54,34 +56,97 @@ FONT_BIG = pygame.font.SysFont("Segoe UI", 36, bold=True)
 FONT_HUGE = pygame.font.SysFont("Segoe UI", 48, bold=True)
 
 # ---- Enhanced Helpers ----
+# Sine lookup table for visual pulses: _SIN_LUT[int(phase * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
+_SIN_LUT_SIZE = 256
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT_QUARTER = _SIN_LUT_SIZE // 4  # Index offset that turns sin into cos
+_SIN_LUT = [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+
+# Rendered gradients keyed by (top_color, bottom_color, width, height)
+_BG_CACHE = {}
+
 def draw_vertical_gradient(surf, top_color, bottom_color, rect=None):
+    """Blit a vertical gradient, rendering it only the first time it's seen"""
     if rect is None:
         rect = surf.get_rect()
     
-    for y in range(rect.height):
-        t = y / (rect.height - 1) if rect.height > 1 else 0
-        r = int(top_color[0] * (1 - t) + bottom_color[0] * t)
-        g = int(top_color[1] * (1 - t) + bottom_color[1] * t)
-        b = int(top_color[2] * (1 - t) + bottom_color[2] * t)
-        pygame.draw.line(surf, (r, g, b), (rect.x, rect.y + y), (rect.x + rect.width, rect.y + y))
+    key = (tuple(top_color), tuple(bottom_color), rect.width, rect.height)
+    gradient = _BG_CACHE.get(key)
+    if gradient is None:
+        # Interpolate a single 1px column, then let pygame stretch it across
+        # the width in C instead of drawing one line per row
+        column = bytearray()
+        for y in range(rect.height):
+            t = y / (rect.height - 1) if rect.height > 1 else 0
+            column.append(int(top_color[0] * (1 - t) + bottom_color[0] * t))
+            column.append(int(top_color[1] * (1 - t) + bottom_color[1] * t))
+            column.append(int(top_color[2] * (1 - t) + bottom_color[2] * t))
+        column_surf = pygame.image.frombytes(bytes(column), (1, rect.height), "RGB")
+        gradient = pygame.transform.scale(column_surf, rect.size).convert()
+        _BG_CACHE[key] = gradient
+    
+    surf.blit(gradient, rect.topleft)
+
+# Shadow surfaces keyed by (width, height, blur, alpha)
+_SHADOW_CACHE = {}
+
+def get_shadow_surface(width, height, blur=8, alpha=60):
+    """Return the blurred shadow for a rect size, building it on first use"""
+    key = (width, height, blur, alpha)
+    shadow_surf = _SHADOW_CACHE.get(key)
+    if shadow_surf is None:
+        shadow_surf = pygame.Surface((width + blur*2, height + blur*2), pygame.SRCALPHA)
+        shadow_rect = pygame.Rect(blur, blur, width, height)
+        
+        # Create multiple shadow layers for blur effect
+        for i in range(blur):
+            alpha_val = alpha * (1 - i/blur) // 2
+            expanded = shadow_rect.inflate(i*2, i*2)
+            pygame.draw.rect(shadow_surf, (0, 0, 0, alpha_val), expanded, border_radius=8)
+        
+        shadow_surf = _SHADOW_CACHE[key] = shadow_surf.convert_alpha()
+    return shadow_surf
 
 def draw_enhanced_shadow(surf, rect, offset=(4, 4), blur=8, alpha=60):
-    """Enhanced shadow with blur effect"""
-    shadow_surf = pygame.Surface((rect.width + blur*2, rect.height + blur*2), pygame.SRCALPHA)
-    shadow_rect = pygame.Rect(blur, blur, rect.width, rect.height)
-    
-    # Create multiple shadow layers for blur effect
-    for i in range(blur):
-        alpha_val = alpha * (1 - i/blur) // 2
-        expanded = shadow_rect.inflate(i*2, i*2)
-        pygame.draw.rect(shadow_surf, (0, 0, 0, alpha_val), expanded, border_radius=8)
-    
+    """Enhanced shadow with blur effect, blitted from a per-size cached surface"""
+    shadow_surf = get_shadow_surface(rect.width, rect.height, blur, alpha)
     surf.blit(shadow_surf, (rect.x + offset[0] - blur, rect.y + offset[1] - blur), 
               special_flags=pygame.BLEND_ALPHA_SDL2)
 
-def draw_text(surf, text, pos, font, color=COLOR_FG, align='center', shadow=True):
+def draw_queued(surf, objects, camera_offset):
+    """Draw objects that queue their blits: glows/shadows in one fblits, images in another"""
+    underlay = []
+    overlay = []
+    for obj in objects:
+        obj.queue_blits(camera_offset, underlay, overlay)
+    surf.fblits(underlay, pygame.BLEND_ALPHA_SDL2)
+    surf.fblits(overlay)
+
+@lru_cache(maxsize=256)
+def render_text_cached(font, text, color):
+    """Rasterize a string once; repeated HUD strings reuse the Surface"""
+    return font.render(text, True, color).convert_alpha()
+
+# Last rendering per (slot, font, color), for readouts whose text keeps changing
+_TEXT_SLOTS = {}
+
+def render_text_slot(slot, font, text, color):
+    """Rasterize into a single-entry slot, re-rendering only when the text changes"""
+    key = (slot, font, color)
+    entry = _TEXT_SLOTS.get(key)
+    if entry is None or entry[0] != text:
+        entry = _TEXT_SLOTS[key] = (text, font.render(text, True, color).convert_alpha())
+    return entry[1]
+
+def draw_text(surf, text, pos, font, color=COLOR_FG, align='center', shadow=True, slot=None):
     """Enhanced text rendering with shadow"""
-    text_surf = font.render(text, True, color)
+    # Strings that change often (timer, debug readout) pass a slot so they keep
+    # one cached rendering each instead of churning the shared LRU
+    if slot is None:
+        text_surf = render_text_cached(font, text, tuple(color))
+    else:
+        text_surf = render_text_slot(slot, font, text, tuple(color))
     text_rect = text_surf.get_rect()
     
     if align == 'center':
@@ -92,13 +157,58 @@ def draw_text(surf, text, pos, font, color=COLOR_FG, align='center', shadow=True
         text_rect.midright = pos
     
     if shadow:
-        shadow_surf = font.render(text, True, (0, 0, 0, 120))
+        if slot is None:
+            shadow_surf = render_text_cached(font, text, (0, 0, 0, 120))
+        else:
+            shadow_surf = render_text_slot(slot, font, text, (0, 0, 0, 120))
         surf.blit(shadow_surf, (text_rect.x + 2, text_rect.y + 2))
     
     surf.blit(text_surf, text_rect)
     return text_rect
 
+# Background star dots keyed by grey level
+_STAR_CACHE = {}
+STAR_RADIUS = 2
+
+def get_star_sprite(brightness):
+    """Return a cached grey dot for draw_atmosphere's parallax stars"""
+    sprite = _STAR_CACHE.get(brightness)
+    if sprite is None:
+        size = STAR_RADIUS * 2 + 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (brightness, brightness, brightness),
+                           (STAR_RADIUS + 1, STAR_RADIUS + 1), STAR_RADIUS)
+        sprite = _STAR_CACHE[brightness] = sprite.convert_alpha()
+    return sprite
+
 # ---- Particle System ----
+# Pre-drawn particle circles keyed by (size, rgb, alpha_step)
+_PARTICLE_SPRITE_CACHE = {}
+PARTICLE_ALPHA_STEPS = 16
+
+def get_particle_sprite(size, rgb, alpha_step):
+    """Return a cached alpha circle so particles never redraw per frame"""
+    key = (size, rgb, alpha_step)
+    sprite = _PARTICLE_SPRITE_CACHE.get(key)
+    if sprite is None:
+        alpha = 255 * alpha_step // PARTICLE_ALPHA_STEPS
+        sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*rgb, alpha), (size, size), size)
+        sprite = _PARTICLE_SPRITE_CACHE[key] = sprite.convert_alpha()
+    return sprite
+
+class Particle:
+    """One particle; __slots__ keeps fields as fixed attributes instead of a dict"""
+    __slots__ = ('px', 'py', 'vx', 'vy', 'life', 'max_life', 'rgb', 'size')
+    
+    def __init__(self, pos, vx, vy, life, color, size):
+        self.px, self.py = pos[0], pos[1]
+        self.vx = vx
+        self.vy = vy
+        self.life = self.max_life = life
+        self.rgb = tuple(color[:3])
+        self.size = size
+
 class ParticleSystem:
     def __init__(self):
         self.particles = []
@@ -109,49 +219,38 @@ class ParticleSystem:
             vy = random.uniform(vel_range[0], -1)
             life = random.uniform(0.5, 1.2)
             size = random.uniform(2, 5)
-            self.particles.append({
-                'pos': list(pos),
-                'vel': [vx, vy],
-                'life': life,
-                'max_life': life,
-                'color': color,
-                'size': size
-            })
+            self.particles.append(Particle(pos, vx, vy, life, color, size))
     
     def add_dust(self, pos, count=5):
         for _ in range(count):
             vx = random.uniform(-1, 1)
             vy = random.uniform(-2, -0.5)
             life = random.uniform(0.3, 0.8)
-            self.particles.append({
-                'pos': list(pos),
-                'vel': [vx, vy],
-                'life': life,
-                'max_life': life,
-                'color': COLOR_DUST,
-                'size': random.uniform(1, 3)
-            })
+            self.particles.append(Particle(pos, vx, vy, life, COLOR_DUST, random.uniform(1, 3)))
     
     def update(self, dt):
-        for particle in self.particles[:]:
-            particle['vel'][1] += GRAVITY * 0.3
-            particle['pos'][0] += particle['vel'][0]
-            particle['pos'][1] += particle['vel'][1]
-            particle['life'] -= dt
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        gravity_step = GRAVITY * 0.3
+        for particle in self.particles:
+            particle.vy += gravity_step
+            particle.px += particle.vx
+            particle.py += particle.vy
+            particle.life -= dt
+        
+        # Rebuild the list once instead of remove() per dead particle
+        self.particles = [particle for particle in self.particles if particle.life > 0]
     
     def draw(self, surf):
+        # Collect every particle into one fblits call using cached sprites;
+        # alpha is bucketed so the cache stays small
+        blit_list = []
         for particle in self.particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            color = (*particle['color'][:3], alpha)
-            size = max(1, int(particle['size'] * (particle['life'] / particle['max_life'])))
-            
-            temp_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf, color, (size, size), size)
-            surf.blit(temp_surf, (particle['pos'][0] - size, particle['pos'][1] - size),
-                     special_flags=pygame.BLEND_ALPHA_SDL2)
+            fade = particle.life / particle.max_life
+            size = max(1, int(particle.size * fade))
+            alpha_step = max(1, round(fade * PARTICLE_ALPHA_STEPS))
+            sprite = get_particle_sprite(size, particle.rgb, alpha_step)
+            blit_list.append((sprite, (particle.px - size, particle.py - size)))
+        
+        surf.fblits(blit_list, pygame.BLEND_ALPHA_SDL2)
 
 # ---- Camera System ----
 class Camera:
@@ -195,6 +294,40 @@ class Camera:
         
         return int(offset_x), int(offset_y)
 
+class SpatialGrid:
+    """Uniform grid that buckets static rects by the cells they touch"""
+    
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (col, row) -> indices into self.rects
+        self.rects = []
+    
+    def _cell_ranges(self, rect):
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+    
+    def insert(self, rect):
+        index = len(self.rects)
+        self.rects.append(rect)
+        cols, rows = self._cell_ranges(rect)
+        for col in cols:
+            for row in rows:
+                self.cells.setdefault((col, row), []).append(index)
+    
+    def query(self, rect):
+        """Return the rects sharing a cell with rect, in insertion order"""
+        found = set()
+        get_cell = self.cells.get
+        cols, rows = self._cell_ranges(rect)
+        for col in cols:
+            for row in rows:
+                bucket = get_cell((col, row))
+                if bucket:
+                    found.update(bucket)
+        rects = self.rects
+        return [rects[index] for index in sorted(found)]
+
 # ---- Enhanced Platform ----
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, w, h, platform_type='normal'):
@@ -218,16 +351,27 @@ class Platform(pygame.sprite.Sprite):
         for i in range(0, self.rect.width, 20):
             pygame.draw.line(self.image, COLOR_PLATFORM_EDGE, 
                            (i, self.rect.height-2), (i+8, self.rect.height-2))
+        
+        # Rounded corners need per-pixel alpha, so convert_alpha rather than convert
+        self.image = self.image.convert_alpha()
     
     def draw(self, surf, camera_offset):
+        draw_queued(surf, (self,), camera_offset)
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
-        draw_rect = pygame.Rect(*draw_pos, self.rect.width, self.rect.height)
-        
-        draw_enhanced_shadow(surf, draw_rect)
-        surf.blit(self.image, draw_pos)
+        # Same placement as draw_enhanced_shadow with its default offset and blur
+        underlay.append((get_shadow_surface(self.rect.width, self.rect.height),
+                         (draw_pos[0] + 4 - 8, draw_pos[1] + 4 - 8)))
+        overlay.append((self.image, draw_pos))
 
 # ---- Enhanced Magic Wall ----
+# Unit vectors for the six crack directions (multiples of 60 degrees)
+_HEX_DIRS = [(math.cos(i * math.pi / 3), math.sin(i * math.pi / 3)) for i in range(6)]
+
 class MagicWall(pygame.sprite.Sprite):
+    CRACK_STEPS = 16  # How finely the crack overlay tracks crack_progress
+    
     def __init__(self, x, y, w, h):
         super().__init__()
         self.rect = pygame.Rect(x, y, w, h)
@@ -237,6 +381,9 @@ class MagicWall(pygame.sprite.Sprite):
         self.crack_progress = 0
         self.health = 2  # Requires 2 hits
         self.shake_timer = 0
+        # Crack lines are redrawn into this overlay only when progress changes
+        self._crack_overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
+        self._crack_step = -1
         
     def hit(self):
         if not self.alive:
@@ -260,6 +407,24 @@ class MagicWall(pygame.sprite.Sprite):
         if self.cracked and self.crack_timer > 0:
             self.crack_timer -= dt
             self.crack_progress = 1 - (self.crack_timer / 0.8)
+        
+        if self.cracked:
+            step = max(0, min(self.CRACK_STEPS, int(self.crack_progress * self.CRACK_STEPS)))
+            if step != self._crack_step:
+                self._crack_step = step
+                self._redraw_cracks(step / self.CRACK_STEPS)
+    
+    def _redraw_cracks(self, progress):
+        self._crack_overlay.fill((0, 0, 0, 0))
+        center = (self.rect.width / 2, self.rect.height / 2)
+        length = self.rect.width * 0.4 * progress
+        # Rotate the fixed directions by the progress twist once, not per line
+        twist_cos = math.cos(progress * 0.5)
+        twist_sin = math.sin(progress * 0.5)
+        for dir_x, dir_y in _HEX_DIRS:
+            end_x = center[0] + (dir_x * twist_cos - dir_y * twist_sin) * length
+            end_y = center[1] + (dir_y * twist_cos + dir_x * twist_sin) * length
+            pygame.draw.line(self._crack_overlay, COLOR_WALL_CRACK, center, (end_x, end_y), 3)
     
     def draw(self, surf, camera_offset):
         if not self.alive:
@@ -282,24 +447,24 @@ class MagicWall(pygame.sprite.Sprite):
         
         # Cracks
         if self.cracked:
-            crack_alpha = int(255 * self.crack_progress)
-            crack_color = (*COLOR_WALL_CRACK[:3], crack_alpha)
-            
-            # Draw crack lines
-            center = draw_rect.center
-            for i in range(6):
-                angle = i * math.pi / 3 + self.crack_progress * 0.5
-                length = self.rect.width * 0.4 * self.crack_progress
-                end_x = center[0] + math.cos(angle) * length
-                end_y = center[1] + math.sin(angle) * length
-                
-                temp_surf = pygame.Surface((abs(end_x - center[0]) + 4, abs(end_y - center[1]) + 4), pygame.SRCALPHA)
-                pygame.draw.line(temp_surf, crack_color, 
-                               (2, 2), (end_x - center[0] + 2, end_y - center[1] + 2), 3)
-                surf.blit(temp_surf, (min(center[0], end_x) - 2, min(center[1], end_y) - 2),
-                         special_flags=pygame.BLEND_ALPHA_SDL2)
+            self._crack_overlay.set_alpha(int(255 * self.crack_progress))
+            surf.blit(self._crack_overlay, draw_rect.topleft)
 
 # ---- Enhanced Spike ----
+# Popup warning glows keyed by (width, height, warn_size, alpha)
+_SPIKE_GLOW_CACHE = {}
+
+def get_spike_glow(width, height, warn_size, alpha):
+    """Return the warning glow for one pulse step; there are only ~100 distinct steps"""
+    key = (width, height, warn_size, alpha)
+    glow_surf = _SPIKE_GLOW_CACHE.get(key)
+    if glow_surf is None:
+        glow_surf = pygame.Surface((width + warn_size*2, height + warn_size*2), pygame.SRCALPHA)
+        glow_center = (width//2 + warn_size, warn_size)
+        pygame.draw.circle(glow_surf, (*COLOR_SPIKE_WARN, alpha), glow_center, warn_size*2)
+        glow_surf = _SPIKE_GLOW_CACHE[key] = glow_surf.convert_alpha()
+    return glow_surf
+
 class Spike(pygame.sprite.Sprite):
     def __init__(self, x, y, w=32, h=26, popup=False, delay=0, move_pattern=None):
         super().__init__()
@@ -313,6 +478,24 @@ class Spike(pygame.sprite.Sprite):
         self.move_pattern = move_pattern or {'type': 'none'}
         self.move_timer = 0
         self.original_pos = (x, y)
+        self._build_image()
+    
+    def _build_image(self):
+        """Pre-render the spike triangle with its shadow and highlight"""
+        w, h = self.rect.width, self.rect.height
+        # Extra pixels hold the bottom edge and the offset shadow
+        self.image = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+        points = [(w//2, 0), (4, h), (w - 4, h)]
+        
+        # Shadow; opaque, as it always was when drawn straight onto the screen
+        shadow_points = [(p[0] + 2, p[1] + 2) for p in points]
+        pygame.draw.polygon(self.image, (0, 0, 0), shadow_points)
+        
+        # Main spike
+        pygame.draw.polygon(self.image, COLOR_SPIKE, points)
+        # Highlight edge
+        pygame.draw.polygon(self.image, (255, 100, 100), points, 2)
+        self.image = self.image.convert_alpha()
         
     def update(self, dt):
         if self.popup and not self.active:
@@ -343,38 +526,72 @@ class Spike(pygame.sprite.Sprite):
         ]
     
     def draw(self, surf, camera_offset):
+        draw_queued(surf, (self,), camera_offset)
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
         
         if self.popup and not self.active:
             # Warning effect
-            intensity = math.sin(self.warn_phase) * 0.5 + 0.5
+            intensity = _SIN_LUT[int(self.warn_phase * _SIN_LUT_SCALE) & _SIN_LUT_MASK] * 0.5 + 0.5
             warn_size = 4 + int(intensity * 8)
-            warn_color = COLOR_SPIKE_WARN
             
             # Warning glow
-            glow_surf = pygame.Surface((self.rect.width + warn_size*2, self.rect.height + warn_size*2), pygame.SRCALPHA)
-            glow_center = (self.rect.width//2 + warn_size, warn_size)
-            pygame.draw.circle(glow_surf, (*warn_color, int(100 * intensity)), glow_center, warn_size*2)
-            surf.blit(glow_surf, (draw_pos[0] - warn_size, draw_pos[1] - warn_size), special_flags=pygame.BLEND_ALPHA_SDL2)
+            glow_surf = get_spike_glow(self.rect.width, self.rect.height, warn_size, int(100 * intensity))
+            underlay.append((glow_surf, (draw_pos[0] - warn_size, draw_pos[1] - warn_size)))
         
         if self.active:
-            # Main spike triangle
-            points = [
-                (draw_pos[0] + self.rect.width//2, draw_pos[1]),
-                (draw_pos[0] + 4, draw_pos[1] + self.rect.height),
-                (draw_pos[0] + self.rect.width - 4, draw_pos[1] + self.rect.height)
-            ]
-            
-            # Shadow
-            shadow_points = [(p[0] + 2, p[1] + 2) for p in points]
-            pygame.draw.polygon(surf, (0, 0, 0, 100), shadow_points)
-            
-            # Main spike
-            pygame.draw.polygon(surf, COLOR_SPIKE, points)
-            # Highlight edge
-            pygame.draw.polygon(surf, (255, 100, 100), points, 2)
+            overlay.append((self.image, draw_pos))
 
 # ---- Enhanced Falling Stone ----
+# Pre-rotated stone frames keyed by (width, height)
+_STONE_ATLAS_CACHE = {}
+STONE_ROTATION_STEP = 10  # Degrees between atlas frames
+# Full-alpha drop-warning outlines keyed by (width, height)
+_STONE_WARNING_CACHE = {}
+
+def get_stone_atlas(width, height):
+    """Build the stone once and pre-rotate it in fixed steps"""
+    key = (width, height)
+    rot_frames = _STONE_ATLAS_CACHE.get(key)
+    if rot_frames is None:
+        stone_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Shadow
+        shadow_rect = pygame.Rect(2, 2, width-2, height-2)
+        pygame.draw.rect(stone_surf, (0, 0, 0, 100), shadow_rect, border_radius=8)
+        
+        # Main stone
+        main_rect = pygame.Rect(0, 0, width, height)
+        pygame.draw.rect(stone_surf, (140, 140, 160), main_rect, border_radius=8)
+        pygame.draw.rect(stone_surf, (160, 160, 180), main_rect, width=3, border_radius=8)
+        
+        # Add stone texture; a private generator bakes one fixed pattern
+        # without consuming the game's random stream
+        rng = random.Random(width * 1000 + height)
+        for i in range(3):
+            for j in range(3):
+                x = i * width // 3 + rng.randint(-2, 2)
+                y = j * height // 3 + rng.randint(-2, 2)
+                pygame.draw.circle(stone_surf, (120, 120, 140), (x, y), 2)
+        
+        rot_frames = _STONE_ATLAS_CACHE[key] = [
+            pygame.transform.rotate(stone_surf, angle).convert_alpha()
+            for angle in range(0, 360, STONE_ROTATION_STEP)
+        ]
+    return rot_frames
+
+def get_stone_warning(width, height):
+    """Return the drop-warning outline, drawn once at full alpha"""
+    key = (width, height)
+    warning_surf = _STONE_WARNING_CACHE.get(key)
+    if warning_surf is None:
+        warning_surf = pygame.Surface((width + 20, height + 20), pygame.SRCALPHA)
+        pygame.draw.rect(warning_surf, (255, 200, 0),
+                       (10, 10, width, height), border_radius=8)
+        warning_surf = _STONE_WARNING_CACHE[key] = warning_surf.convert_alpha()
+    return warning_surf
+
 class FallingStone(pygame.sprite.Sprite):
     def __init__(self, x, top_y, trigger_range, warning_time=1.0):
         super().__init__()
@@ -390,13 +607,19 @@ class FallingStone(pygame.sprite.Sprite):
         self.trigger_range = trigger_range
         self.bounces = 0
         self.max_bounces = 2
+        self.rot_frames = get_stone_atlas(self.rect.width, self.rect.height)
+        # Own copy of the outline, since each stone blinks with its own alpha
+        self.warning_image = get_stone_warning(self.rect.width, self.rect.height).copy()
     
     def trigger_check(self, player_x):
+        """Start the warning once the player enters range; True on that frame"""
         if not self.dropped and not self.warning:
             if self.trigger_range[0] <= player_x <= self.trigger_range[1]:
                 self.warning = True
+                return True
+        return False
     
-    def update(self, dt, platforms, particles):
+    def update(self, dt, platform_rects, particles):
         if self.warning and not self.dropped:
             self.warning_timer -= dt
             if self.warning_timer <= 0:
@@ -405,89 +628,86 @@ class FallingStone(pygame.sprite.Sprite):
                 self.angular_velocity = random.uniform(-5, 5)
         
         if self.dropped and not self.settled:
-            # Realistic physics
-            self.vy += GRAVITY * 1.5
-            self.vy = min(self.vy, TERMINAL_VELOCITY)
+            # Realistic physics on locals, written back at the end
+            rect = self.rect
+            vx = self.vx
+            vy = self.vy + GRAVITY * 1.5
+            if vy > TERMINAL_VELOCITY:
+                vy = TERMINAL_VELOCITY
             
-            old_pos = self.rect.copy()
-            self.rect.x += int(self.vx)
-            self.rect.y += int(self.vy)
+            rect.x += int(vx)
+            rect.y += int(vy)
             self.rotation += self.angular_velocity * dt
             
-            # Collision with platforms
-            for platform in platforms:
-                if self.rect.colliderect(platform.rect):
-                    if self.bounces < self.max_bounces:
-                        # Bounce
-                        self.rect.bottom = platform.rect.top
-                        self.vy = -self.vy * 0.4  # Energy loss
-                        self.vx += random.uniform(-2, 2)  # Random horizontal component
-                        self.angular_velocity *= 0.7
-                        self.bounces += 1
-                        
-                        # Impact particles
-                        particles.add_explosion(
-                            (self.rect.centerx, self.rect.bottom),
-                            count=15,
-                            color=COLOR_IMPACT
-                        )
-                    else:
-                        # Settle
-                        self.rect.bottom = platform.rect.top
-                        self.vy = 0
-                        self.vx *= 0.8  # Friction
-                        self.angular_velocity *= 0.9
-                        if abs(self.vx) < 0.1 and abs(self.angular_velocity) < 0.1:
-                            self.settled = True
-                        
-                        # Final impact particles
-                        particles.add_explosion(
-                            (self.rect.centerx, self.rect.bottom),
-                            count=25,
-                            color=COLOR_IMPACT
-                        )
-                    break
+            # Collision with platforms: collidelist finds the first platform
+            # hit in C, in the same order the old loop checked them
+            hit = rect.collidelist(platform_rects)
+            if hit != -1:
+                rect.bottom = platform_rects[hit].top
+                if self.bounces < self.max_bounces:
+                    # Bounce
+                    vy = -vy * 0.4  # Energy loss
+                    vx += random.uniform(-2, 2)  # Random horizontal component
+                    self.angular_velocity *= 0.7
+                    self.bounces += 1
+                    
+                    # Impact particles
+                    particles.add_explosion(
+                        (rect.centerx, rect.bottom),
+                        count=15,
+                        color=COLOR_IMPACT
+                    )
+                else:
+                    # Settle
+                    vy = 0
+                    vx *= 0.8  # Friction
+                    self.angular_velocity *= 0.9
+                    if abs(vx) < 0.1 and abs(self.angular_velocity) < 0.1:
+                        self.settled = True
+                    
+                    # Final impact particles
+                    particles.add_explosion(
+                        (rect.centerx, rect.bottom),
+                        count=25,
+                        color=COLOR_IMPACT
+                    )
+            
+            self.vx = vx
+            self.vy = vy
     
     def draw(self, surf, camera_offset):
+        draw_queued(surf, (self,), camera_offset)
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
         
         if self.warning and not self.dropped:
             # Warning indicator
-            alpha = int(128 + 127 * math.sin(self.warning_timer * 10))
-            warning_surf = pygame.Surface((self.rect.width + 20, self.rect.height + 20), pygame.SRCALPHA)
-            pygame.draw.rect(warning_surf, (255, 200, 0, alpha), 
-                           (10, 10, self.rect.width, self.rect.height), border_radius=8)
-            surf.blit(warning_surf, (draw_pos[0] - 10, draw_pos[1] - 10), special_flags=pygame.BLEND_ALPHA_SDL2)
-        
-        # Create rotated stone surface
-        stone_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        
-        # Shadow
-        shadow_rect = pygame.Rect(2, 2, self.rect.width-2, self.rect.height-2)
-        pygame.draw.rect(stone_surf, (0, 0, 0, 100), shadow_rect, border_radius=8)
-        
-        # Main stone
-        main_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
-        pygame.draw.rect(stone_surf, (140, 140, 160), main_rect, border_radius=8)
-        pygame.draw.rect(stone_surf, (160, 160, 180), main_rect, width=3, border_radius=8)
-        
-        # Add stone texture
-        for i in range(3):
-            for j in range(3):
-                x = i * self.rect.width // 3 + random.randint(-2, 2)
-                y = j * self.rect.height // 3 + random.randint(-2, 2)
-                pygame.draw.circle(stone_surf, (120, 120, 140), (x, y), 2)
-        
-        # Rotate the surface
-        if abs(self.rotation) > 0.1:
-            rotated_surf = pygame.transform.rotate(stone_surf, math.degrees(self.rotation))
-            rotated_rect = rotated_surf.get_rect(center=(draw_pos[0] + self.rect.width//2, 
-                                                        draw_pos[1] + self.rect.height//2))
-            surf.blit(rotated_surf, rotated_rect)
-        else:
-            surf.blit(stone_surf, draw_pos)
+            alpha = int(128 + 127 * _SIN_LUT[int(self.warning_timer * 10 * _SIN_LUT_SCALE) & _SIN_LUT_MASK])
+            self.warning_image.set_alpha(alpha)
+            underlay.append((self.warning_image, (draw_pos[0] - 10, draw_pos[1] - 10)))
+        
+        # Pick the nearest pre-rotated frame instead of rotating every frame
+        frame = round(math.degrees(self.rotation) / STONE_ROTATION_STEP) % len(self.rot_frames)
+        rotated_surf = self.rot_frames[frame]
+        rotated_rect = rotated_surf.get_rect(center=(draw_pos[0] + self.rect.width//2, 
+                                                    draw_pos[1] + self.rect.height//2))
+        overlay.append((rotated_surf, rotated_rect))
 
 # ---- Enhanced Door ----
+# Open-door glow circles keyed by (radius, alpha)
+_DOOR_GLOW_CACHE = {}
+
+def get_door_glow(radius, alpha):
+    """Return the open-door glow circle for one pulse radius"""
+    key = (radius, alpha)
+    glow_surf = _DOOR_GLOW_CACHE.get(key)
+    if glow_surf is None:
+        glow_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surf, (*COLOR_DOOR, alpha), (radius, radius), radius)
+        glow_surf = _DOOR_GLOW_CACHE[key] = glow_surf.convert_alpha()
+    return glow_surf
+
 class Door:
     def __init__(self, pos1, pos2):
         self.rect = pygame.Rect(pos1[0], pos1[1], 40, 60)
@@ -497,6 +717,16 @@ class Door:
         self.pulse = 0
         self.glow_intensity = 0
         self.teleport_particles = []
+        # Door body (frame, plus the dark interior while locked) per open state
+        self._body_images = {False: self._build_body(False), True: self._build_body(True)}
+    
+    def _build_body(self, is_open):
+        image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        body = image.get_rect()
+        pygame.draw.rect(image, COLOR_DOOR if is_open else COLOR_DOOR_LOCKED, body, border_radius=8)
+        if not is_open:
+            pygame.draw.rect(image, (30, 30, 40), body.inflate(-12, -16), border_radius=4)
+        return image.convert_alpha()
         
     def maybe_troll(self, player_rect, particles):
         # Only troll if player approaches from the sides or top, not from bottom
@@ -535,39 +765,61 @@ class Door:
         
         # Glow effect
         if self.open:
-            glow_radius = int(30 + 15 * math.sin(self.pulse))
-            glow_color = (*COLOR_DOOR, int(60 * self.glow_intensity))
-            glow_surf = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, glow_color, (glow_radius, glow_radius), glow_radius)
+            glow_radius = int(30 + 15 * _SIN_LUT[int(self.pulse * _SIN_LUT_SCALE) & _SIN_LUT_MASK])
+            glow_surf = get_door_glow(glow_radius, int(60 * self.glow_intensity))
             surf.blit(glow_surf, (draw_rect.centerx - glow_radius, draw_rect.centery - glow_radius), 
                      special_flags=pygame.BLEND_ALPHA_SDL2)
         
         # Door shadow
         draw_enhanced_shadow(surf, draw_rect)
         
-        # Door frame
-        door_color = COLOR_DOOR if self.open else COLOR_DOOR_LOCKED
-        pygame.draw.rect(surf, door_color, draw_rect, border_radius=8)
+        # Door frame and, while locked, its interior
+        surf.blit(self._body_images[self.open], draw_pos)
         
-        # Door interior
-        inner_rect = draw_rect.inflate(-12, -16)
+        # Swirling portal; animated, so still drawn live
         if self.open:
-            # Swirling portal effect
+            inner_rect = draw_rect.inflate(-12, -16)
             portal_color = (100, 255, 200, 150)
             for i in range(3):
-                angle = self.pulse + i * (2 * math.pi / 3)
+                index = int((self.pulse + i * (2 * math.pi / 3)) * _SIN_LUT_SCALE)
                 radius = inner_rect.width // 4
-                center_x = inner_rect.centerx + math.cos(angle) * radius // 3
-                center_y = inner_rect.centery + math.sin(angle) * radius // 3
+                center_x = inner_rect.centerx + _SIN_LUT[(index + _SIN_LUT_QUARTER) & _SIN_LUT_MASK] * radius // 3
+                center_y = inner_rect.centery + _SIN_LUT[index & _SIN_LUT_MASK] * radius // 3
                 pygame.draw.circle(surf, portal_color, (int(center_x), int(center_y)), radius//2)
-        else:
-            pygame.draw.rect(surf, (30, 30, 40), inner_rect, border_radius=4)
         
         # Door handle
         handle_pos = (draw_rect.right - 12, draw_rect.centery)
         pygame.draw.circle(surf, (200, 200, 210), handle_pos, 4)
 
 # ---- Enhanced Player ----
+def _build_speed_line(alpha):
+    line_surf = pygame.Surface((6, 2), pygame.SRCALPHA)
+    pygame.draw.rect(line_surf, (255, 255, 255, alpha), (0, 0, 6, 2))
+    return line_surf.convert_alpha()
+
+# The three fading speed lines never change, so build them once
+_SPEED_LINE_SURFS = [_build_speed_line(100 - i * 30) for i in range(3)]
+
+# Body and highlight keyed by squashed (width, height); squash_stretch only
+# spans 0.7-1.0, so there are at most a few dozen sizes
+_PLAYER_BODY_CACHE = {}
+
+def get_player_body(width, height):
+    """Return the player's body with its highlight for one squashed size"""
+    key = (width, height)
+    body = _PLAYER_BODY_CACHE.get(key)
+    if body is None:
+        body = pygame.Surface(key, pygame.SRCALPHA)
+        body_rect = body.get_rect()
+        pygame.draw.rect(body, COLOR_PLAYER, body_rect, border_radius=8)
+        
+        # Body highlight
+        highlight_rect = body_rect.inflate(-4, -4)
+        highlight_rect.height = max(4, highlight_rect.height // 3)
+        pygame.draw.rect(body, COLOR_PLAYER_SHADOW, highlight_rect, border_radius=6)
+        body = _PLAYER_BODY_CACHE[key] = body.convert_alpha()
+    return body
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
@@ -638,68 +890,76 @@ class Player(pygame.sprite.Sprite):
         if self.coyote_timer > 0:
             self.coyote_timer -= dt
     
-    def physics(self, dt, platforms, particles):
-        # Apply gravity
-        if not self.on_ground:
-            self.vy += GRAVITY
-            self.vy = min(self.vy, TERMINAL_VELOCITY)
+    def physics(self, dt, platform_rects, particles):
+        # Work on locals and write back once at the end; this runs every frame
+        rect = self.rect
+        vx = self.vx
+        vy = self.vy
+        was_on_ground = self.on_ground
         
-        # Store old position for collision resolution
-        old_rect = self.rect.copy()
+        # Apply gravity
+        if not was_on_ground:
+            vy += GRAVITY
+            if vy > TERMINAL_VELOCITY:
+                vy = TERMINAL_VELOCITY
         
         # Horizontal movement
-        self.rect.x += int(self.vx)
+        rect.x += int(vx)
         
         # Horizontal collisions
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                if self.vx > 0:  # Moving right
-                    self.rect.right = platform.rect.left
-                    self.vx = 0
-                elif self.vx < 0:  # Moving left
-                    self.rect.left = platform.rect.right
-                    self.vx = 0
+        for i in rect.collidelistall(platform_rects):
+            platform = platform_rects[i]
+            if vx > 0:  # Moving right
+                rect.right = platform.left
+                vx = 0
+            elif vx < 0:  # Moving left
+                rect.left = platform.right
+                vx = 0
         
         # Vertical movement
-        self.rect.y += int(self.vy)
+        rect.y += int(vy)
         
         # Vertical collisions
-        was_on_ground = self.on_ground
-        self.on_ground = False
-        
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                if self.vy > 0:  # Falling down
-                    self.rect.bottom = platform.rect.top
-                    if self.vy > 8:  # Hard landing
-                        self.squash_stretch = 0.7
-                        particles.add_dust((self.rect.centerx, self.rect.bottom), count=8)
-                    self.vy = 0
-                    self.on_ground = True
-                    self.has_double_jumped = False
-                    self.can_double_jump = True
-                elif self.vy < 0:  # Jumping up
-                    self.rect.top = platform.rect.bottom
-                    self.vy = 0
+        on_ground = False
+        
+        for i in rect.collidelistall(platform_rects):
+            platform = platform_rects[i]
+            if vy > 0:  # Falling down
+                rect.bottom = platform.top
+                if vy > 8:  # Hard landing
+                    self.squash_stretch = 0.7
+                    particles.add_dust((rect.centerx, rect.bottom), count=8)
+                vy = 0
+                on_ground = True
+                self.has_double_jumped = False
+                self.can_double_jump = True
+            elif vy < 0:  # Jumping up
+                rect.top = platform.bottom
+                vy = 0
         
         # Coyote time - grace period for jumping after leaving ground
-        if was_on_ground and not self.on_ground:
-            self.coyote_timer = self.coyote_time
-        elif self.on_ground:
+        if was_on_ground or on_ground:
             self.coyote_timer = self.coyote_time
         
         # Keep player in bounds
-        self.rect.left = max(0, self.rect.left)
-        self.rect.right = min(WIDTH, self.rect.right)
+        if rect.left < 0:
+            rect.left = 0
+        if rect.right > WIDTH:
+            rect.right = WIDTH
         
-        if self.rect.top < 0:
-            self.rect.top = 0
-            self.vy = max(0, self.vy)
+        if rect.top < 0:
+            rect.top = 0
+            if vy < 0:
+                vy = 0
         
-        if self.rect.bottom > HEIGHT:
-            self.rect.bottom = HEIGHT
-            self.vy = 0
-            self.on_ground = True
+        if rect.bottom > HEIGHT:
+            rect.bottom = HEIGHT
+            vy = 0
+            on_ground = True
+        
+        self.vx = vx
+        self.vy = vy
+        self.on_ground = on_ground
         
         # Generate dust particles when moving on ground
         if self.on_ground and abs(self.vx) > 2:
@@ -732,13 +992,8 @@ class Player(pygame.sprite.Sprite):
         # Shadow
         draw_enhanced_shadow(surf, draw_rect, offset=(3, 3))
         
-        # Main body
-        pygame.draw.rect(surf, COLOR_PLAYER, draw_rect, border_radius=8)
-        
-        # Body highlight
-        highlight_rect = draw_rect.inflate(-4, -4)
-        highlight_rect.height = max(4, highlight_rect.height // 3)
-        pygame.draw.rect(surf, COLOR_PLAYER_SHADOW, highlight_rect, border_radius=6)
+        # Main body and highlight; the face depends on movement, so it stays live
+        surf.blit(get_player_body(draw_width, draw_height), draw_rect)
         
         # Eyes
         eye_y = draw_rect.y + max(8, draw_height // 4)
@@ -778,27 +1033,61 @@ class Player(pygame.sprite.Sprite):
         if abs(self.vx) > 4:
             for i in range(3):
                 line_x = draw_rect.left - 8 - i*4 if self.vx > 0 else draw_rect.right + 8 + i*4
-                line_alpha = 100 - i * 30
-                line_surf = pygame.Surface((6, 2), pygame.SRCALPHA)
-                pygame.draw.rect(line_surf, (255, 255, 255, line_alpha), (0, 0, 6, 2))
-                surf.blit(line_surf, (line_x, draw_rect.centery + i*3 - 3), special_flags=pygame.BLEND_ALPHA_SDL2)
+                surf.blit(_SPEED_LINE_SURFS[i], (line_x, draw_rect.centery + i*3 - 3), special_flags=pygame.BLEND_ALPHA_SDL2)
 
 # ---- Game Class ----
 class Game:
+    CONTROLS = (
+        "Move: A/D or ←/→",
+        "Jump: W/↑/Space (Double Jump Available!)",
+        "Reset: R  |  Quit: ESC"
+    )
+    # (text, font, color) of every HUD string that never changes
+    STATIC_TEXT = (
+        ("ENHANCED DEVILISH PLATFORMER", FONT_BIG, COLOR_FG),
+        ("💀 YOU DIED 💀", FONT_BIG, (255, 100, 100)),
+        ("🎉 VICTORY! 🎉", FONT_BIG, (100, 255, 150)),
+        ("Press R to try again", FONT_BIG, (255, 200, 200)),
+        ("Incredible! Press R to play again", FONT_BIG, (200, 255, 200)),
+        ("That door looks suspicious... 🤔", FONT_SMALL, (200, 200, 255)),
+        ("The wall is cracking! Hit it again! 💥", FONT_SMALL, (200, 200, 255)),
+        ("Try breaking through that wall... 🧱", FONT_SMALL, (200, 200, 255)),
+        ("Watch out for falling objects! ⚠", FONT_SMALL, (200, 200, 255)),
+        *((control, FONT_SMALL, COLOR_FG) for control in CONTROLS),
+    )
+    
     def __init__(self):
         self.state = GameState.PLAYING
         self.camera = Camera()
         self.particles = ParticleSystem()
-        self.start_time = time.time()
+        # One monotonic clock read per update(); every timer and animation
+        # in the frame uses it
+        self._t0 = self._now = time.monotonic()
+        self.start_time = self._now
         self.death_time = None
         self.win_time = None
         self.best_time = float('inf')
         self.attempts = 0
+        # Rasterize the fixed HUD strings up front so the first frames don't stall
+        for text, font, color in self.STATIC_TEXT:
+            render_text_cached(font, text, color)
+            render_text_cached(font, text, (0, 0, 0, 120))
+        # Fog bands are rasterised once as opaque white; draw_atmosphere only
+        # changes their surface alpha
+        self._fog_cache = []
+        for _ in range(4):
+            fog_surf = pygame.Surface((WIDTH + 200, 80), pygame.SRCALPHA)
+            pygame.draw.ellipse(fog_surf, (255, 255, 255, 255), fog_surf.get_rect())
+            self._fog_cache.append(fog_surf.convert_alpha())
         
         self.setup_level()
     
     def setup_level(self):
         """Create the enhanced level with realistic physics"""
+        # Stones only ever go warning -> dropped, so once one has warned
+        # the "falling objects" tip is gone for the rest of the run
+        self._any_stone_triggered = False
+        self._tips_state = None  # Forces draw_ui to rebuild the tips
         self.platforms = []
         
         # Ground and main platforms
@@ -814,6 +1103,12 @@ class Game:
         self.platforms.append(Platform(580, HEIGHT-160, 60, 16))   # Gap bridge
         self.platforms.append(Platform(820, HEIGHT-240, 70, 16))   # Precision jump
         
+        # Platforms never move, so bucket their rects once; moving entities
+        # only test the platforms in the grid cells they can reach
+        self.platform_grid = SpatialGrid()
+        for platform in self.platforms:
+            self.platform_grid.insert(platform.rect)
+        
         # Magic wall - now requires multiple hits
         self.magic_wall = MagicWall(350, HEIGHT-140, 70, 80)
         
@@ -868,18 +1163,20 @@ class Game:
                 )
                 self.camera.add_shake(4, 0.3)
         
-        # Spike collisions - use precise triangle collision
-        for spike in self.spikes:
-            danger_zone = spike.get_danger_zone()
+        # Spike collisions - each danger triangle lies inside its spike's rect,
+        # so one C-level pass over the rects (grown by a pixel to keep corner
+        # points on the edges) leaves only the spikes worth a triangle test
+        spikes = self.spikes
+        for index in self.player.rect.inflate(2, 2).collidelistall(spikes):
+            danger_zone = spikes[index].get_danger_zone()
             if danger_zone and self.point_in_triangle_collision(self.player.rect, danger_zone):
                 self.kill_player()
                 return
         
         # Falling stone collisions
-        for stone in self.falling_stones:
-            if stone.rect.colliderect(self.player.rect):
-                self.kill_player()
-                return
+        if self.player.rect.collidelist(self.falling_stones) != -1:
+            self.kill_player()
+            return
         
         # Door interactions
         self.door.maybe_troll(self.player.rect, self.particles)
@@ -893,39 +1190,28 @@ class Game:
     
     def point_in_triangle_collision(self, rect, triangle_points):
         """Check if rectangle overlaps with triangle"""
-        # Simple overlap check - test if any corner of rect is inside triangle
-        corners = [
-            (rect.left, rect.top), (rect.right, rect.top),
-            (rect.left, rect.bottom), (rect.right, rect.bottom),
-            (rect.centerx, rect.centery)  # Also check center
-        ]
-        
-        for corner in corners:
-            if self.point_in_triangle(corner, triangle_points):
+        # Simple overlap check - test if any corner of rect (or its center) is
+        # inside the triangle, i.e. on the same side of all three edges. The
+        # edge terms that don't depend on the point are worked out once
+        (x1, y1), (x2, y2), (x3, y3) = triangle_points
+        ex1, ey1 = x1 - x2, y1 - y2
+        ex2, ey2 = x2 - x3, y2 - y3
+        ex3, ey3 = x3 - x1, y3 - y1
+        
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        for x, y in ((left, top), (right, top), (left, bottom), (right, bottom),
+                     ((left + right) // 2, (top + bottom) // 2)):
+            d1 = (x - x2) * ey1 - ex1 * (y - y2)
+            d2 = (x - x3) * ey2 - ex2 * (y - y3)
+            d3 = (x - x1) * ey3 - ex3 * (y - y1)
+            if not ((d1 < 0 or d2 < 0 or d3 < 0) and (d1 > 0 or d2 > 0 or d3 > 0)):
                 return True
         return False
     
-    def point_in_triangle(self, point, triangle):
-        """Check if point is inside triangle using barycentric coordinates"""
-        x, y = point
-        x1, y1 = triangle[0]
-        x2, y2 = triangle[1]
-        x3, y3 = triangle[2]
-        
-        denominator = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3)
-        if abs(denominator) < 0.001:
-            return False
-        
-        a = ((y2 - y3) * (x - x3) + (x3 - x2) * (y - y3)) / denominator
-        b = ((y3 - y1) * (x - x3) + (x1 - x3) * (y - y3)) / denominator
-        c = 1 - a - b
-        
-        return a >= 0 and b >= 0 and c >= 0
-    
     def kill_player(self):
         self.state = GameState.DEAD
         self.player.dead = True
-        self.death_time = time.time()
+        self.death_time = self._now
         self.attempts += 1
         
         # Death particles
@@ -940,7 +1226,7 @@ class Game:
     def win_game(self):
         self.state = GameState.WON
         self.player.win = True
-        self.win_time = time.time()
+        self.win_time = self._now
         
         current_time = self.win_time - self.start_time
         if current_time < self.best_time:
@@ -957,7 +1243,7 @@ class Game:
     
     def reset_game(self):
         self.state = GameState.PLAYING
-        self.start_time = time.time()
+        self.start_time = self._now
         self.death_time = None
         self.win_time = None
         self.setup_level()
@@ -965,6 +1251,8 @@ class Game:
         self.camera = Camera()
     
     def update(self, dt, keys):
+        self._now = time.monotonic()
+        
         # Handle input
         if keys[pygame.K_r]:
             self.reset_game()
@@ -978,20 +1266,23 @@ class Game:
             self.player.control(keys, dt)
         
         # Physics for all objects
-        platforms_for_collision = [p for p in self.platforms]
+        # query() hands back a fresh list, so the wall is appended in place
+        reach = self.player.rect.inflate(COLLISION_QUERY_MARGIN * 2, COLLISION_QUERY_MARGIN * 2)
+        collision_rects = self.platform_grid.query(reach)
         if self.magic_wall.alive:
-            platforms_for_collision.append(Platform(self.magic_wall.rect.x, self.magic_wall.rect.y,
-                                                   self.magic_wall.rect.width, self.magic_wall.rect.height))
+            collision_rects.append(self.magic_wall.rect)
         
-        self.player.physics(dt, platforms_for_collision, self.particles)
+        self.player.physics(dt, collision_rects, self.particles)
         
         # Update other objects
         for spike in self.spikes:
             spike.update(dt)
         
         for stone in self.falling_stones:
-            stone.trigger_check(self.player.rect.centerx)
-            stone.update(dt, self.platforms, self.particles)
+            if stone.trigger_check(self.player.rect.centerx):
+                self._any_stone_triggered = True
+            reach = stone.rect.inflate(COLLISION_QUERY_MARGIN * 2, COLLISION_QUERY_MARGIN * 2)
+            stone.update(dt, self.platform_grid.query(reach), self.particles)
         
         self.magic_wall.update(dt)
         self.door.update(dt)
@@ -1019,18 +1310,28 @@ class Game:
         # Get camera offset
         camera_offset = self.camera.get_offset()
         
-        # Draw game objects
-        for platform in self.platforms:
-            platform.draw(surf, camera_offset)
+        # Visible world area with a margin for shadows, glows and shake;
+        # collidelistall picks the entities inside it in one C call
+        view_rect = pygame.Rect(-camera_offset[0] - 100, -camera_offset[1] - 100,
+                                WIDTH + 200, HEIGHT + 200)
         
-        self.magic_wall.draw(surf, camera_offset)
+        # Draw game objects; platforms and spikes are pure blits, so each
+        # group goes out as one fblits for its shadows/glows and one for images
+        platforms = self.platforms
+        draw_queued(surf, [platforms[i] for i in view_rect.collidelistall(platforms)], camera_offset)
         
-        for spike in self.spikes:
-            spike.draw(surf, camera_offset)
+        if view_rect.colliderect(self.magic_wall.rect):
+            self.magic_wall.draw(surf, camera_offset)
         
-        for stone in self.falling_stones:
-            stone.draw(surf, camera_offset)
+        spikes = self.spikes
+        draw_queued(surf, [spikes[i] for i in view_rect.collidelistall(spikes)], camera_offset)
+        
+        # Stone warnings go out with the shadows/glows, so every visible
+        # stone is again one fblits per layer
+        stones = self.falling_stones
+        draw_queued(surf, [stones[i] for i in view_rect.collidelistall(stones)], camera_offset)
         
+        # Always draw the door as it's important for game progression
         self.door.draw(surf, camera_offset)
         self.player.draw(surf, camera_offset)
         
@@ -1042,24 +1343,33 @@ class Game:
     
     def draw_atmosphere(self, surf):
         """Draw atmospheric effects"""
-        t = pygame.time.get_ticks() / 1000.0
+        t = self._now - self._t0
+        blit = surf.blit
+        
+        # Purely decorative motion, so the shared sine table is accurate enough
+        lut = _SIN_LUT
+        scale = _SIN_LUT_SCALE
+        mask = _SIN_LUT_MASK
         
         # Floating fog layers
-        for i in range(4):
-            y = int(100 + i * 120 + math.sin(t * 0.3 + i) * 20)
-            alpha = 30 + int(20 * math.sin(t * 0.5 + i))
+        drift_phase = t * 0.3
+        pulse_phase = t * 0.5
+        for i, fog_surf in enumerate(self._fog_cache):
+            y = int(100 + i * 120 + lut[int((drift_phase + i) * scale) & mask] * 20)
+            alpha = 30 + int(20 * lut[int((pulse_phase + i) * scale) & mask])
             
-            fog_surf = pygame.Surface((WIDTH + 200, 80), pygame.SRCALPHA)
-            pygame.draw.ellipse(fog_surf, (255, 255, 255, alpha), (0, 0, WIDTH + 200, 80))
-            surf.blit(fog_surf, (-100 + i * 30, y), special_flags=pygame.BLEND_ALPHA_SDL2)
+            fog_surf.set_alpha(alpha)
+            blit(fog_surf, (-100 + i * 30, y), special_flags=pygame.BLEND_ALPHA_SDL2)
         
-        # Parallax background elements
+        # Parallax background elements; the stars move every frame, so only
+        # the dot itself is cached, one sprite per grey level
+        sway_phase = t * 0.1
         for i in range(6):
-            star_x = int((i * 200 + math.sin(t * 0.1 + i) * 30) % WIDTH)
+            star_x = int((i * 200 + lut[int((sway_phase + i) * scale) & mask] * 30) % WIDTH)
             star_y = int(50 + i * 60)
-            brightness = int(100 + 50 * math.sin(t + i))
-            pygame.draw.circle(surf, (brightness, brightness, brightness), 
-                             (star_x, star_y), 2)
+            brightness = int(100 + 50 * lut[int((t + i) * scale) & mask])
+            blit(get_star_sprite(brightness),
+                 (star_x - STAR_RADIUS - 1, star_y - STAR_RADIUS - 1))
     
     def draw_ui(self, surf):
         """Enhanced UI with better information display"""
@@ -1079,14 +1389,14 @@ class Game:
         draw_text(surf, title_text, (WIDTH // 2, 40), FONT_BIG, title_color)
         
         # Timer
-        current_time = time.time() - self.start_time
+        current_time = self._now - self.start_time
         if self.state == GameState.DEAD and self.death_time:
             current_time = self.death_time - self.start_time
         elif self.state == GameState.WON and self.win_time:
             current_time = self.win_time - self.start_time
         
         timer_text = f"Time: {current_time:.2f}s"
-        draw_text(surf, timer_text, (WIDTH - 100, 30), FONT, align='right')
+        draw_text(surf, timer_text, (WIDTH - 100, 30), FONT, align='right', slot='timer')
         
         # Attempts counter
         attempts_text = f"Attempts: {self.attempts}"
@@ -1098,13 +1408,7 @@ class Game:
             draw_text(surf, best_text, (WIDTH - 100, 90), FONT, align='right')
         
         # Controls
-        controls = [
-            "Move: A/D or ←/→",
-            "Jump: W/↑/Space (Double Jump Available!)",
-            "Reset: R  |  Quit: ESC"
-        ]
-        
-        for i, control in enumerate(controls):
+        for i, control in enumerate(self.CONTROLS):
             draw_text(surf, control, (WIDTH // 2, HEIGHT - 100 + i * 25), FONT_SMALL)
         
         # Game state messages
@@ -1113,19 +1417,25 @@ class Game:
         elif self.state == GameState.WON:
             draw_text(surf, "Incredible! Press R to play again", (WIDTH // 2, HEIGHT // 2), FONT_BIG, (200, 255, 200))
         elif self.state == GameState.PLAYING:
-            # Gameplay tips
-            tips = []
-            if not self.door.trolled_once:
-                tips.append("That door looks suspicious... 🤔")
-            if self.magic_wall.alive:
-                if self.magic_wall.cracked:
-                    tips.append("The wall is cracking! Hit it again! 💥")
-                else:
-                    tips.append("Try breaking through that wall... 🧱")
-            if not any(stone.warning or stone.dropped for stone in self.falling_stones):
-                tips.append("Watch out for falling objects! ⚠")
+            # Gameplay tips; the list only changes when the door, wall or
+            # stones change state, so it is rebuilt only then
+            tips_state = (self.door.trolled_once, self.magic_wall.alive,
+                          self.magic_wall.cracked, self._any_stone_triggered)
+            if tips_state != self._tips_state:
+                self._tips_state = tips_state
+                tips = []
+                if not self.door.trolled_once:
+                    tips.append("That door looks suspicious... 🤔")
+                if self.magic_wall.alive:
+                    if self.magic_wall.cracked:
+                        tips.append("The wall is cracking! Hit it again! 💥")
+                    else:
+                        tips.append("Try breaking through that wall... 🧱")
+                if not self._any_stone_triggered:
+                    tips.append("Watch out for falling objects! ⚠")
+                self._tips = tips[:2]  # Show max 2 tips
             
-            for i, tip in enumerate(tips[:2]):  # Show max 2 tips
+            for i, tip in enumerate(self._tips):
                 draw_text(surf, tip, (WIDTH // 2, 100 + i * 30), FONT_SMALL, (200, 200, 255))
         
         # Player info (debug-style info)
@@ -1139,7 +1449,7 @@ class Game:
             
             for i, info in enumerate(player_info):
                 draw_text(surf, info, (100, HEIGHT - 120 + i * 20), FONT_SMALL, 
-                         (150, 150, 150), align='left', shadow=False)
+                         (150, 150, 150), align='left', shadow=False, slot=('player_info', i))
 
 # ---- Main Game Loop ----
 def main():
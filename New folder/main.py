@@ -1,7 +1,9 @@
 import math, random, sys, time
 import pygame
 import asyncio
+from collections import deque
 from enum import Enum
+from functools import lru_cache
 
 # ---------------
 # CONFIG / COLORS
@@ -45,8 +47,10 @@ class GameState(Enum):
 
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)  # For cheap off-screen culling
+PLAYER_QUERY_MARGIN = 32  # Covers the furthest the player moves in one physics step
+NEAR_BAND_EXTENT = 1 << 20  # Half-height of the band used for "near the player" tests
 pygame.display.set_caption("Enhanced Devilish Platformer")
-clock = pygame.time.Clock()
 
 # Enhanced fonts
 FONT_SMALL = pygame.font.SysFont("Segoe UI", 16)
@@ -54,40 +58,130 @@ FONT = pygame.font.SysFont("Segoe UI", 24, bold=True)
 FONT_BIG = pygame.font.SysFont("Segoe UI", 36, bold=True)
 FONT_HUGE = pygame.font.SysFont("Segoe UI", 48, bold=True)
 
+# Key constants bound once for Player.control
+_K_LEFT, _K_RIGHT, _K_UP = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP
+_K_A, _K_D, _K_W, _K_SPACE = pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_SPACE
+
 # ---- Enhanced Helpers ----
+# Unit vectors for the six crack directions (multiples of 60 degrees)
+_HEX_DIRS = [(math.cos(i * math.pi / 3), math.sin(i * math.pi / 3)) for i in range(6)]
+
+# Sine lookup table for visual pulses: _SIN_LUT[int(phase * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
+_SIN_LUT_SIZE = 256
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+
+# Rendered gradients keyed by (top_color, bottom_color, width, height)
+_BG_CACHE = {}
+
 def draw_vertical_gradient(surf, top_color, bottom_color, rect=None):
+    """Blit a vertical gradient, rendering it only the first time it's seen"""
     if rect is None:
         rect = surf.get_rect()
     
-    for y in range(rect.height):
-        t = y / (rect.height - 1) if rect.height > 1 else 0
-        r = int(top_color[0] * (1 - t) + bottom_color[0] * t)
-        g = int(top_color[1] * (1 - t) + bottom_color[1] * t)
-        b = int(top_color[2] * (1 - t) + bottom_color[2] * t)
-        pygame.draw.line(surf, (r, g, b), (rect.x, rect.y + y), (rect.x + rect.width, rect.y + y))
+    key = (tuple(top_color), tuple(bottom_color), rect.width, rect.height)
+    gradient = _BG_CACHE.get(key)
+    if gradient is None:
+        # Interpolate a single 1px column, then let pygame stretch it across
+        # the width in C instead of drawing one line per row
+        column = bytearray()
+        for y in range(rect.height):
+            t = y / (rect.height - 1) if rect.height > 1 else 0
+            column.append(int(top_color[0] * (1 - t) + bottom_color[0] * t))
+            column.append(int(top_color[1] * (1 - t) + bottom_color[1] * t))
+            column.append(int(top_color[2] * (1 - t) + bottom_color[2] * t))
+        column_surf = pygame.image.frombytes(bytes(column), (1, rect.height), "RGB")
+        gradient = pygame.transform.scale(column_surf, rect.size).convert()
+        _BG_CACHE[key] = gradient
+    
+    surf.blit(gradient, rect.topleft)
 
-def draw_enhanced_shadow(surf, rect, offset=(4, 4), blur=4, alpha=60):
-    """Optimized shadow with reduced blur effect"""
+# Background star dots keyed by grey level
+_STAR_CACHE = {}
+STAR_RADIUS = 2
+
+def get_star_sprite(brightness):
+    """Return a cached grey dot for draw_atmosphere's parallax stars"""
+    sprite = _STAR_CACHE.get(brightness)
+    if sprite is None:
+        size = STAR_RADIUS * 2 + 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (brightness, brightness, brightness),
+                           (STAR_RADIUS + 1, STAR_RADIUS + 1), STAR_RADIUS)
+        sprite = _STAR_CACHE[brightness] = sprite.convert_alpha()
+    return sprite
+
+# Shadow surfaces keyed by (width, height, blur, alpha)
+_SHADOW_CACHE = {}
+
+def get_shadow_surface(width, height, blur=4, alpha=60):
+    """Return a cached shadow for a rect size, or None if it's too small to need one"""
     # Skip shadow rendering for small objects to improve performance
-    if rect.width < 20 or rect.height < 20:
-        return
+    if width < 20 or height < 20:
+        return None
+    
+    key = (width, height, blur, alpha)
+    shadow_surf = _SHADOW_CACHE.get(key)
+    if shadow_surf is None:
+        shadow_surf = pygame.Surface((width + blur*2, height + blur*2), pygame.SRCALPHA)
+        shadow_rect = pygame.Rect(blur, blur, width, height)
         
-    # Use a smaller blur radius
-    shadow_surf = pygame.Surface((rect.width + blur*2, rect.height + blur*2), pygame.SRCALPHA)
-    shadow_rect = pygame.Rect(blur, blur, rect.width, rect.height)
+        # Create fewer shadow layers (only 2 instead of blur count)
+        for i in range(2):
+            alpha_val = alpha * (1 - i/2) // 2
+            expanded = shadow_rect.inflate(i*blur, i*blur)
+            pygame.draw.rect(shadow_surf, (0, 0, 0, alpha_val), expanded, border_radius=4)
+        shadow_surf = _SHADOW_CACHE[key] = shadow_surf.convert_alpha()
+    return shadow_surf
+
+def draw_enhanced_shadow(surf, rect, offset=(4, 4), blur=4, alpha=60):
+    """Optimized shadow blitted from a per-size cached surface"""
+    x = rect.x + offset[0] - blur
+    y = rect.y + offset[1] - blur
+    # Nothing to do if the shadow lands entirely off screen
+    if not SCREEN_RECT.colliderect(x, y, rect.width + blur*2, rect.height + blur*2):
+        return
     
-    # Create fewer shadow layers (only 2 instead of blur count)
-    for i in range(2):
-        alpha_val = alpha * (1 - i/2) // 2
-        expanded = shadow_rect.inflate(i*blur, i*blur)
-        pygame.draw.rect(shadow_surf, (0, 0, 0, alpha_val), expanded, border_radius=4)
+    shadow_surf = get_shadow_surface(rect.width, rect.height, blur, alpha)
+    if shadow_surf is None:
+        return
     
-    surf.blit(shadow_surf, (rect.x + offset[0] - blur, rect.y + offset[1] - blur), 
-              special_flags=pygame.BLEND_ALPHA_SDL2)
+    surf.blit(shadow_surf, (x, y), special_flags=pygame.BLEND_ALPHA_SDL2)
+
+def draw_queued(surf, objects, camera_offset):
+    """Draw objects that queue their blits: glows/shadows in one fblits, images in another"""
+    underlay = []
+    overlay = []
+    for obj in objects:
+        obj.queue_blits(camera_offset, underlay, overlay)
+    surf.fblits(underlay, pygame.BLEND_ALPHA_SDL2)
+    surf.fblits(overlay)
+
+@lru_cache(maxsize=256)
+def render_text_cached(font, text, color):
+    """Rasterize a string once; repeated HUD strings reuse the Surface"""
+    return font.render(text, True, color).convert_alpha()
+
+# Last rendering per (slot, font, color), for readouts whose text keeps changing
+_TEXT_SLOTS = {}
 
-def draw_text(surf, text, pos, font, color=COLOR_FG, align='center', shadow=True):
+def render_text_slot(slot, font, text, color):
+    """Rasterize into a single-entry slot, re-rendering only when the text changes"""
+    key = (slot, font, color)
+    entry = _TEXT_SLOTS.get(key)
+    if entry is None or entry[0] != text:
+        entry = _TEXT_SLOTS[key] = (text, font.render(text, True, color).convert_alpha())
+    return entry[1]
+
+def draw_text(surf, text, pos, font, color=COLOR_FG, align='center', shadow=True, slot=None):
     """Enhanced text rendering with shadow"""
-    text_surf = font.render(text, True, color)
+    # Strings that change often (timer, debug readout) pass a slot so they keep
+    # one cached rendering each instead of churning the shared LRU
+    if slot is None:
+        text_surf = render_text_cached(font, text, tuple(color))
+    else:
+        text_surf = render_text_slot(slot, font, text, tuple(color))
     text_rect = text_surf.get_rect()
     
     if align == 'center':
@@ -98,93 +192,134 @@ def draw_text(surf, text, pos, font, color=COLOR_FG, align='center', shadow=True
         text_rect.midright = pos
     
     if shadow:
-        shadow_surf = font.render(text, True, (0, 0, 0, 120))
+        if slot is None:
+            shadow_surf = render_text_cached(font, text, (0, 0, 0, 120))
+        else:
+            shadow_surf = render_text_slot(slot, font, text, (0, 0, 0, 120))
         surf.blit(shadow_surf, (text_rect.x + 2, text_rect.y + 2))
     
     surf.blit(text_surf, text_rect)
     return text_rect
 
 # ---- Optimized Particle System ----
+# Pre-drawn particle circles keyed by (size, rgb, alpha_step)
+_PARTICLE_SPRITE_CACHE = {}
+PARTICLE_ALPHA_STEPS = 8
+
+def get_particle_sprite(size, rgb, alpha_step):
+    """Return a cached alpha circle so particles never redraw per frame"""
+    key = (size, rgb, alpha_step)
+    sprite = _PARTICLE_SPRITE_CACHE.get(key)
+    if sprite is None:
+        alpha = 255 * alpha_step // PARTICLE_ALPHA_STEPS
+        sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*rgb, alpha), (size, size), size)
+        sprite = _PARTICLE_SPRITE_CACHE[key] = sprite.convert_alpha()
+    return sprite
+
+class Particle:
+    """Reusable particle slot owned by a ParticleSystem pool"""
+    __slots__ = ('px', 'py', 'vx', 'vy', 'life', 'max_life', 'rgb', 'size', 'alive')
+    
+    def __init__(self):
+        self.px = self.py = 0.0
+        self.vx = self.vy = 0.0
+        self.life = self.max_life = 0.0
+        self.rgb = COLOR_PARTICLE
+        self.size = 1.0
+        self.alive = False
+
 class ParticleSystem:
     def __init__(self):
-        self.particles = []
         self.max_particles = 100  # Limit total particles
+        # Pre-allocated pool: spawning reuses free slots instead of allocating
+        self._pool = [Particle() for _ in range(self.max_particles)]
+        self._free = list(self._pool)
+        self._active = deque()  # Live particles in spawn order (oldest first)
+    
+    def _spawn(self, pos, vx, vy, life, color, size):
+        particle = self._free.pop()
+        particle.px, particle.py = pos[0], pos[1]
+        particle.vx, particle.vy = vx, vy
+        particle.life = particle.max_life = life
+        particle.rgb = tuple(color[:3])
+        particle.size = size
+        particle.alive = True
+        self._active.append(particle)
+    
+    def _release_oldest(self, count):
+        # Hand the oldest slots back to the free stack to make room;
+        # popping from the head of the deque avoids a slice copy
+        pop_oldest = self._active.popleft
+        for _ in range(count):
+            particle = pop_oldest()
+            particle.alive = False
+            self._free.append(particle)
     
     def add_explosion(self, pos, count=10, color=COLOR_IMPACT, vel_range=(-5, 5)):
         # Reduce particle count for explosions
         count = min(count, 10)
         
         # Check if adding would exceed max particles
-        if len(self.particles) + count > self.max_particles:
+        if count > len(self._free):
             # Remove oldest particles to make room
-            self.particles = self.particles[-(self.max_particles - count):]
+            self._release_oldest(count - len(self._free))
             
         for _ in range(count):
             vx = random.uniform(vel_range[0], vel_range[1])
             vy = random.uniform(vel_range[0], -1)
             life = random.uniform(0.5, 1.0)  # Slightly shorter life
             size = random.uniform(2, 4)  # Slightly smaller
-            self.particles.append({
-                'pos': list(pos),
-                'vel': [vx, vy],
-                'life': life,
-                'max_life': life,
-                'color': color,
-                'size': size
-            })
+            self._spawn(pos, vx, vy, life, color, size)
     
     def add_dust(self, pos, count=3):  # Reduced dust count
         # Check if adding would exceed max particles
-        if len(self.particles) + count > self.max_particles:
+        if count > len(self._free):
             return  # Skip dust if too many particles
             
         for _ in range(count):
             vx = random.uniform(-1, 1)
             vy = random.uniform(-2, -0.5)
             life = random.uniform(0.2, 0.6)  # Shorter life
-            self.particles.append({
-                'pos': list(pos),
-                'vel': [vx, vy],
-                'life': life,
-                'max_life': life,
-                'color': COLOR_DUST,
-                'size': random.uniform(1, 2)  # Smaller dust
-            })
+            self._spawn(pos, vx, vy, life, COLOR_DUST, random.uniform(1, 2))  # Smaller dust
     
     def update(self, dt):
-        # Use direct list comprehension instead of slice copy and remove
-        self.particles = [p for p in self.particles if self._update_particle(p, dt)]
-    
-    def _update_particle(self, particle, dt):
-        # Update single particle and return False if it should be removed
-        particle['vel'][1] += GRAVITY * 0.3
-        particle['pos'][0] += particle['vel'][0]
-        particle['pos'][1] += particle['vel'][1]
-        particle['life'] -= dt
-        return particle['life'] > 0
+        # Rotate through the active queue once, re-queueing survivors in
+        # order and returning dead slots to the pool. Slots are iterated
+        # directly: a pure-Python SoA layout (parallel lists or array.array
+        # columns) measured slower than __slots__ access.
+        active = self._active
+        take = active.popleft
+        keep = active.append
+        release = self._free.append
+        gravity_step = GRAVITY * 0.3
+        for _ in range(len(active)):
+            particle = take()
+            particle.vy += gravity_step
+            particle.px += particle.vx
+            particle.py += particle.vy
+            particle.life -= dt
+            if particle.life > 0:
+                keep(particle)
+            else:
+                particle.alive = False
+                release(particle)
     
     def draw(self, surf):
-        # Use a single surface for all particles of the same size
-        size_groups = {}
-        
-        for particle in self.particles:
-            size = max(1, int(particle['size'] * (particle['life'] / particle['max_life'])))
-            if size not in size_groups:
-                size_groups[size] = []
-            size_groups[size].append(particle)
-        
-        # Draw particles by size group
-        for size, particles in size_groups.items():
-            temp_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            
-            for particle in particles:
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                color = (*particle['color'][:3], alpha)
-                pygame.draw.circle(temp_surf, color, (size, size), size)
-                surf.blit(temp_surf, (particle['pos'][0] - size, particle['pos'][1] - size),
-                         special_flags=pygame.BLEND_ALPHA_SDL2)
-                # Reset surface for next particle
-                temp_surf.fill((0,0,0,0))
+        # Collect every particle into one fblits call using cached sprites.
+        # fblits accepts mixed sources, so no per-(size, color) grouping is needed
+        blit_list = []
+        append = blit_list.append
+        cached = _PARTICLE_SPRITE_CACHE.get
+        for particle in self._active:
+            fade = particle.life / particle.max_life
+            size = max(1, int(particle.size * fade))
+            alpha_step = max(1, round(fade * PARTICLE_ALPHA_STEPS))
+            sprite = (cached((size, particle.rgb, alpha_step))
+                      or get_particle_sprite(size, particle.rgb, alpha_step))
+            append((sprite, (particle.px - size, particle.py - size)))
+        
+        surf.fblits(blit_list, pygame.BLEND_ALPHA_SDL2)
 
 # ---- Camera System ----
 class Camera:
@@ -228,8 +363,48 @@ class Camera:
         
         return int(offset_x), int(offset_y)
 
+# ---- Spatial Grid ----
+class SpatialGrid:
+    """Uniform grid that buckets static rects by the cells they touch"""
+    
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (col, row) -> indices into self.rects
+        self.rects = []
+    
+    def _cell_ranges(self, rect):
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+    
+    def insert(self, rect):
+        index = len(self.rects)
+        self.rects.append(rect)
+        cols, rows = self._cell_ranges(rect)
+        for col in cols:
+            for row in rows:
+                self.cells.setdefault((col, row), []).append(index)
+    
+    def query(self, rect):
+        """Return the rects sharing a cell with rect, in insertion order"""
+        found = set()
+        get_cell = self.cells.get
+        cols, rows = self._cell_ranges(rect)
+        for col in cols:
+            for row in rows:
+                bucket = get_cell((col, row))
+                if bucket:
+                    found.update(bucket)
+        rects = self.rects
+        return [rects[index] for index in sorted(found)]
+
 # ---- Enhanced Platform ----
+# Platform images shared by every platform of the same (w, h, type)
+_PLATFORM_IMG_CACHE = {}
+
 class Platform(pygame.sprite.Sprite):
+    casts_shadow = True
+    
     def __init__(self, x, y, w, h, platform_type='normal'):
         super().__init__()
         self.rect = pygame.Rect(x, y, w, h)
@@ -237,6 +412,11 @@ class Platform(pygame.sprite.Sprite):
         self.create_surface()
     
     def create_surface(self):
+        key = (self.rect.width, self.rect.height, self.platform_type)
+        self.image = _PLATFORM_IMG_CACHE.get(key)
+        if self.image is not None:
+            return
+        
         self.image = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
         
         # Main platform
@@ -251,25 +431,64 @@ class Platform(pygame.sprite.Sprite):
         for i in range(0, self.rect.width, 20):
             pygame.draw.line(self.image, COLOR_PLATFORM_EDGE, 
                            (i, self.rect.height-2), (i+8, self.rect.height-2))
+        
+        self.image = _PLATFORM_IMG_CACHE[key] = self.image.convert_alpha()
     
     def draw(self, surf, camera_offset):
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
         draw_rect = pygame.Rect(*draw_pos, self.rect.width, self.rect.height)
+        if not SCREEN_RECT.colliderect(draw_rect.inflate(16, 16)):
+            return
         
         draw_enhanced_shadow(surf, draw_rect)
         surf.blit(self.image, draw_pos)
 
+# ---- Camera Sprite Group ----
+class CameraGroup(pygame.sprite.LayeredUpdates):
+    """Sprite group drawn through the camera with batched fblits calls"""
+    
+    def draw(self, surf, camera_offset, view_rect=None, offset=(4, 4), blur=4):
+        """Draw all sprites overlapping view_rect: one fblits for shadows, one for images"""
+        shadow_blits = []
+        image_blits = []
+        sprites = self.sprites()
+        if view_rect is not None:
+            # collidelistall picks the visible sprites in one C call
+            sprites = [sprites[i] for i in view_rect.collidelistall(sprites)]
+        for sprite in sprites:
+            rect = sprite.rect
+            x = rect.x + camera_offset[0]
+            y = rect.y + camera_offset[1]
+            if sprite.casts_shadow:
+                shadow = get_shadow_surface(rect.width, rect.height, blur)
+                if shadow is not None:
+                    shadow_blits.append((shadow, (x + offset[0] - blur, y + offset[1] - blur)))
+            image_blits.append((sprite.image, (x, y)))
+        
+        surf.fblits(shadow_blits, pygame.BLEND_ALPHA_SDL2)
+        surf.fblits(image_blits)
+
 # ---- Enhanced Magic Wall ----
 class MagicWall(pygame.sprite.Sprite):
+    CRACK_STEPS = 16  # How finely the crack overlay tracks crack_progress
+    
     def __init__(self, x, y, w, h):
         super().__init__()
         self.rect = pygame.Rect(x, y, w, h)
+        self.cx = self.rect.centerx  # The wall never moves, so cache its centre
         self.alive = True
         self.cracked = False
         self.crack_timer = 0
         self.crack_progress = 0
         self.health = 2  # Requires 2 hits
         self.shake_timer = 0
+        self.on_remove = None  # Called once when the wall stops blocking
+        # Crack lines are redrawn into this overlay only when progress changes
+        self._crack_overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
+        self._base_image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self._base_image, COLOR_WALL, self._base_image.get_rect(), border_radius=8)
+        self._base_image = self._base_image.convert_alpha()
+        self._crack_step = -1
         
     def hit(self):
         if not self.alive:
@@ -280,6 +499,8 @@ class MagicWall(pygame.sprite.Sprite):
         
         if self.health <= 0:
             self.alive = False
+            if self.on_remove:
+                self.on_remove(self)
             return True  # Wall destroyed
         else:
             self.cracked = True
@@ -293,6 +514,24 @@ class MagicWall(pygame.sprite.Sprite):
         if self.cracked and self.crack_timer > 0:
             self.crack_timer -= dt
             self.crack_progress = 1 - (self.crack_timer / 0.8)
+        
+        if self.cracked:
+            step = max(0, min(self.CRACK_STEPS, int(self.crack_progress * self.CRACK_STEPS)))
+            if step != self._crack_step:
+                self._crack_step = step
+                self._redraw_cracks(step / self.CRACK_STEPS)
+    
+    def _redraw_cracks(self, progress):
+        self._crack_overlay.fill((0, 0, 0, 0))
+        center = (self.rect.width / 2, self.rect.height / 2)
+        length = self.rect.width * 0.4 * progress
+        # Rotate the fixed directions by the progress twist once, not per line
+        twist_cos = math.cos(progress * 0.5)
+        twist_sin = math.sin(progress * 0.5)
+        for dir_x, dir_y in _HEX_DIRS:
+            end_x = center[0] + (dir_x * twist_cos - dir_y * twist_sin) * length
+            end_y = center[1] + (dir_y * twist_cos + dir_x * twist_sin) * length
+            pygame.draw.line(self._crack_overlay, COLOR_WALL_CRACK, center, (end_x, end_y), 3)
     
     def draw(self, surf, camera_offset):
         if not self.alive:
@@ -308,32 +547,23 @@ class MagicWall(pygame.sprite.Sprite):
             draw_pos[1] += random.uniform(-1, 1)
         
         draw_rect = pygame.Rect(*draw_pos, self.rect.width, self.rect.height)
+        # Margin covers the shadow and shake offset
+        if not SCREEN_RECT.colliderect(draw_rect.inflate(16, 16)):
+            return
         draw_enhanced_shadow(surf, draw_rect)
         
         # Main wall
-        pygame.draw.rect(surf, COLOR_WALL, draw_rect, border_radius=8)
+        surf.blit(self._base_image, draw_rect.topleft)
         
         # Cracks
         if self.cracked:
-            crack_alpha = int(255 * self.crack_progress)
-            crack_color = (*COLOR_WALL_CRACK[:3], crack_alpha)
-            
-            # Draw crack lines
-            center = draw_rect.center
-            for i in range(6):
-                angle = i * math.pi / 3 + self.crack_progress * 0.5
-                length = self.rect.width * 0.4 * self.crack_progress
-                end_x = center[0] + math.cos(angle) * length
-                end_y = center[1] + math.sin(angle) * length
-                
-                temp_surf = pygame.Surface((abs(end_x - center[0]) + 4, abs(end_y - center[1]) + 4), pygame.SRCALPHA)
-                pygame.draw.line(temp_surf, crack_color, 
-                               (2, 2), (end_x - center[0] + 2, end_y - center[1] + 2), 3)
-                surf.blit(temp_surf, (min(center[0], end_x) - 2, min(center[1], end_y) - 2),
-                         special_flags=pygame.BLEND_ALPHA_SDL2)
+            self._crack_overlay.set_alpha(int(255 * self.crack_progress))
+            surf.blit(self._crack_overlay, draw_rect.topleft)
 
 # ---- Fake Platform (Disappears when touched) ----
 class FakePlatform(pygame.sprite.Sprite):
+    casts_shadow = True
+    
     def __init__(self, x, y, w, h, delay=0.5):
         super().__init__()
         self.rect = pygame.Rect(x, y, w, h)
@@ -342,6 +572,7 @@ class FakePlatform(pygame.sprite.Sprite):
         self.disappear_timer = 0
         self.disappear_delay = delay
         self.alpha = 255
+        self.on_remove = None  # Called once when the platform stops being solid
         self.create_surface()
     
     def create_surface(self):
@@ -359,20 +590,29 @@ class FakePlatform(pygame.sprite.Sprite):
         for i in range(0, self.rect.width, 15):
             pygame.draw.line(self.image, (160, 140, 120), 
                            (i, self.rect.height-2), (i+6, self.rect.height-2))
+        
+        self.image = self.image.convert_alpha()
     
     def trigger(self):
         if self.active and not self.triggered:
             self.triggered = True
             self.disappear_timer = self.disappear_delay
+            # Fade a private copy through its surface alpha; no shadow while fading
+            self.image = self.image.copy()
+            self.casts_shadow = False
+            if self.on_remove:
+                self.on_remove(self)
     
     def update(self, dt):
-        if self.triggered:
+        if self.triggered and self.active:
             self.disappear_timer -= dt
             if self.disappear_timer <= 0:
                 self.active = False
+                self.kill()  # Drop out of the draw group
             else:
                 # Fade out effect
                 self.alpha = int(255 * (self.disappear_timer / self.disappear_delay))
+                self.image.set_alpha(self.alpha)
     
     def draw(self, surf, camera_offset):
         if not self.active:
@@ -380,17 +620,15 @@ class FakePlatform(pygame.sprite.Sprite):
             
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
         
-        if self.triggered:
-            # Create a copy with alpha for fading effect
-            faded_image = self.image.copy()
-            faded_image.set_alpha(self.alpha)
-            surf.blit(faded_image, draw_pos)
-        else:
+        if self.casts_shadow:
             draw_enhanced_shadow(surf, pygame.Rect(*draw_pos, self.rect.width, self.rect.height))
-            surf.blit(self.image, draw_pos)
+        surf.blit(self.image, draw_pos)
 
 # ---- Teleport Trap ----
 class TeleportTrap(pygame.sprite.Sprite):
+    GLOW_FRAMES = 8  # Discrete pulse levels for the cached glow
+    SYMBOL_PAD = 6   # Room for the symbol lines that overhang the trap
+    
     def __init__(self, x, y, w, h, dest):
         super().__init__()
         self.rect = pygame.Rect(x, y, w, h)
@@ -398,6 +636,34 @@ class TeleportTrap(pygame.sprite.Sprite):
         self.cooldown = 0
         self.cooldown_max = 3.0  # Seconds before it can teleport again
         self.pulse = 0
+        self.create_surfaces()
+    
+    def create_surfaces(self):
+        """Pre-render the trap body (ready/cooling) and the glow pulse frames"""
+        self.ready_image = self._build_image((80, 180, 240))
+        self.cooling_image = self._build_image((60, 120, 180))
+        
+        glow_size = (self.rect.width + 20, self.rect.height + 20)
+        self.glow_frames = []
+        for i in range(self.GLOW_FRAMES + 1):
+            glow_surf = pygame.Surface(glow_size, pygame.SRCALPHA)
+            glow_color = (100, 200, 255, int(100 * i / self.GLOW_FRAMES))
+            pygame.draw.ellipse(glow_surf, glow_color, (0, 0, *glow_size))
+            self.glow_frames.append(glow_surf.convert_alpha())
+    
+    def _build_image(self, color):
+        pad = self.SYMBOL_PAD
+        image = pygame.Surface((self.rect.width + pad*2, self.rect.height + pad*2), pygame.SRCALPHA)
+        body = pygame.Rect(pad, pad, self.rect.width, self.rect.height)
+        pygame.draw.rect(image, color, body, border_radius=4)
+        
+        # Teleport symbol
+        symbol_color = (220, 240, 255)
+        center_x, center_y = body.centerx, body.centery
+        pygame.draw.circle(image, symbol_color, (center_x, center_y), min(self.rect.width, self.rect.height) // 4, 1)
+        pygame.draw.line(image, symbol_color, (center_x - 5, center_y - 5), (center_x + 5, center_y + 5), 1)
+        pygame.draw.line(image, symbol_color, (center_x + 5, center_y - 5), (center_x - 5, center_y + 5), 1)
+        return image.convert_alpha()
     
     def update(self, dt):
         if self.cooldown > 0:
@@ -422,26 +688,19 @@ class TeleportTrap(pygame.sprite.Sprite):
         return None
     
     def draw(self, surf, camera_offset):
+        draw_queued(surf, (self,), camera_offset)
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
-        draw_rect = pygame.Rect(*draw_pos, self.rect.width, self.rect.height)
         
         # Glow effect
-        glow_intensity = 0.5 + 0.5 * math.sin(self.pulse)
-        glow_color = (100, 200, 255, int(100 * glow_intensity))
-        glow_surf = pygame.Surface((self.rect.width + 20, self.rect.height + 20), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, glow_color, (0, 0, self.rect.width + 20, self.rect.height + 20))
-        surf.blit(glow_surf, (draw_pos[0] - 10, draw_pos[1] - 10), special_flags=pygame.BLEND_ALPHA_SDL2)
+        glow_intensity = 0.5 + 0.5 * _SIN_LUT[int(self.pulse * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
+        glow_surf = self.glow_frames[int(glow_intensity * self.GLOW_FRAMES)]
+        underlay.append((glow_surf, (draw_pos[0] - 10, draw_pos[1] - 10)))
         
         # Main trap
-        color = (80, 180, 240) if self.cooldown <= 0 else (60, 120, 180)
-        pygame.draw.rect(surf, color, draw_rect, border_radius=4)
-        
-        # Teleport symbol
-        symbol_color = (220, 240, 255)
-        center_x, center_y = draw_rect.centerx, draw_rect.centery
-        pygame.draw.circle(surf, symbol_color, (center_x, center_y), min(self.rect.width, self.rect.height) // 4, 1)
-        pygame.draw.line(surf, symbol_color, (center_x - 5, center_y - 5), (center_x + 5, center_y + 5), 1)
-        pygame.draw.line(surf, symbol_color, (center_x + 5, center_y - 5), (center_x - 5, center_y + 5), 1)
+        image = self.ready_image if self.cooldown <= 0 else self.cooling_image
+        overlay.append((image, (draw_pos[0] - self.SYMBOL_PAD, draw_pos[1] - self.SYMBOL_PAD)))
 
 # ---- Fake Door (Kills Player) ----
 class FakeDoor(pygame.sprite.Sprite):
@@ -451,6 +710,34 @@ class FakeDoor(pygame.sprite.Sprite):
         self.pulse = 0
         self.triggered = False
         self.trigger_timer = 0
+        self.create_surface()
+    
+    def create_surface(self):
+        """Pre-render the door body and the skull hint"""
+        self.image = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        body = self.image.get_rect()
+        
+        # Door frame - slightly different color from real door
+        door_color = (180, 120, 200)
+        pygame.draw.rect(self.image, door_color, body, border_radius=8)
+        
+        # Door interior
+        inner_rect = body.inflate(-12, -16)
+        pygame.draw.rect(self.image, (40, 30, 50), inner_rect, border_radius=4)
+        
+        # Door handle
+        handle_pos = (body.right - 12, body.centery)
+        pygame.draw.circle(self.image, (220, 180, 230), handle_pos, 4)
+        self.image = self.image.convert_alpha()
+        
+        # Subtle hint that it's fake (small skull symbol)
+        skull_color = (200, 200, 200, 100)
+        self.skull_image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.circle(self.skull_image, skull_color, (5, 5), 3)
+        pygame.draw.circle(self.skull_image, skull_color, (3, 4), 1)
+        pygame.draw.circle(self.skull_image, skull_color, (7, 4), 1)
+        pygame.draw.line(self.skull_image, skull_color, (3, 7), (7, 7), 1)
+        self.skull_image = self.skull_image.convert_alpha()
     
     def update(self, dt):
         self.pulse += dt * 2
@@ -461,35 +748,37 @@ class FakeDoor(pygame.sprite.Sprite):
         return player_rect.colliderect(self.rect.inflate(-10, -10))
     
     def draw(self, surf, camera_offset):
-        draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
-        draw_rect = pygame.Rect(*draw_pos, self.rect.width, self.rect.height)
-        
-        # Door shadow
-        draw_enhanced_shadow(surf, draw_rect)
-        
-        # Door frame - slightly different color from real door
-        door_color = (180, 120, 200)
-        pygame.draw.rect(surf, door_color, draw_rect, border_radius=8)
+        draw_queued(surf, (self,), camera_offset)
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
+        draw_x = self.rect.x + camera_offset[0]
+        draw_y = self.rect.y + camera_offset[1]
         
-        # Door interior
-        inner_rect = draw_rect.inflate(-12, -16)
-        pygame.draw.rect(surf, (40, 30, 50), inner_rect, border_radius=4)
+        # Door shadow (default offset of 4 cancels the blur padding of 4)
+        shadow = get_shadow_surface(self.rect.width, self.rect.height)
+        if shadow is not None:
+            underlay.append((shadow, (draw_x, draw_y)))
+        overlay.append((self.image, (draw_x, draw_y)))
         
-        # Door handle
-        handle_pos = (draw_rect.right - 12, draw_rect.centery)
-        pygame.draw.circle(surf, (220, 180, 230), handle_pos, 4)
-        
-        # Subtle hint that it's fake (small skull symbol)
-        if math.sin(self.pulse) > 0.8:
-            skull_color = (200, 200, 200, 100)
-            skull_surf = pygame.Surface((10, 10), pygame.SRCALPHA)
-            pygame.draw.circle(skull_surf, skull_color, (5, 5), 3)
-            pygame.draw.circle(skull_surf, skull_color, (3, 4), 1)
-            pygame.draw.circle(skull_surf, skull_color, (7, 4), 1)
-            pygame.draw.line(skull_surf, skull_color, (3, 7), (7, 7), 1)
-            surf.blit(skull_surf, (draw_rect.centerx - 5, draw_rect.centery - 5), special_flags=pygame.BLEND_ALPHA_SDL2)
+        if _SIN_LUT[int(self.pulse * _SIN_LUT_SCALE) & _SIN_LUT_MASK] > 0.8:
+            overlay.append((self.skull_image, (draw_x + self.rect.width // 2 - 5,
+                                               draw_y + self.rect.height // 2 - 5)))
 
 # ---- Enhanced Spike ----
+# Popup warning glows keyed by (width, height, warn_size, alpha)
+_SPIKE_GLOW_CACHE = {}
+
+def get_spike_glow(width, height, warn_size, alpha):
+    """Return the warning glow for one pulse step; there are only ~100 distinct steps"""
+    key = (width, height, warn_size, alpha)
+    glow_surf = _SPIKE_GLOW_CACHE.get(key)
+    if glow_surf is None:
+        glow_surf = pygame.Surface((width + warn_size*2, height + warn_size*2), pygame.SRCALPHA)
+        glow_center = (width//2 + warn_size, warn_size)
+        pygame.draw.circle(glow_surf, (*COLOR_SPIKE_WARN, alpha), glow_center, warn_size*2)
+        glow_surf = _SPIKE_GLOW_CACHE[key] = glow_surf.convert_alpha()
+    return glow_surf
+
 class Spike(pygame.sprite.Sprite):
     def __init__(self, x, y, w=32, h=26, popup=False, delay=0, move_pattern=None):
         super().__init__()
@@ -503,24 +792,64 @@ class Spike(pygame.sprite.Sprite):
         self.move_pattern = move_pattern or {'type': 'none'}
         self.move_timer = 0
         self.original_pos = (x, y)
+        self._bind_movement()
+        self._build_image()
+    
+    def _bind_movement(self):
+        """Resolve the move pattern once so update() doesn't re-read the dict"""
+        pattern_type = self.move_pattern['type']
+        if pattern_type == 'horizontal':
+            self._move_speed = self.move_pattern.get('speed', 2)
+            self._move_range = self.move_pattern.get('range', 100)
+            self._update_move = self._move_horizontal
+        elif pattern_type == 'vertical':
+            self._move_speed = self.move_pattern.get('speed', 1.5)
+            self._move_range = self.move_pattern.get('range', 50)
+            self._update_move = self._move_vertical
+        else:
+            self._update_move = self._move_none
+        # Popup spikes tick their arming timer until they activate, then
+        # switch straight to the movement step
+        self._step = self._update_arming if self.popup and not self.active else self._update_move
+    
+    def _build_image(self):
+        """Pre-render the spike triangle with its shadow and highlight"""
+        w, h = self.rect.width, self.rect.height
+        # Extra pixels hold the bottom edge and the offset shadow
+        self.image = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+        points = [(w//2, 0), (4, h), (w - 4, h)]
+        
+        # Shadow; opaque, as it always was when drawn straight onto the screen
+        shadow_points = [(p[0] + 2, p[1] + 2) for p in points]
+        pygame.draw.polygon(self.image, (0, 0, 0), shadow_points)
+        
+        # Main spike
+        pygame.draw.polygon(self.image, COLOR_SPIKE, points)
+        # Highlight edge
+        pygame.draw.polygon(self.image, (255, 100, 100), points, 2)
+        self.image = self.image.convert_alpha()
         
     def update(self, dt):
-        if self.popup and not self.active:
-            self.timer -= dt
-            self.warn_phase += dt * 8
-            if self.timer <= 0:
-                self.active = True
-        
-        # Movement patterns
+        self._step(dt)
+    
+    def _update_arming(self, dt):
+        self.timer -= dt
+        self.warn_phase += dt * 8
+        if self.timer <= 0:
+            self.active = True
+            self._step = self._update_move
+        self._update_move(dt)
+    
+    def _move_none(self, dt):
+        self.move_timer += dt
+    
+    def _move_horizontal(self, dt):
+        self.move_timer += dt
+        self.rect.x = self.original_pos[0] + math.sin(self.move_timer * self._move_speed) * self._move_range
+    
+    def _move_vertical(self, dt):
         self.move_timer += dt
-        if self.move_pattern['type'] == 'horizontal':
-            speed = self.move_pattern.get('speed', 2)
-            range_val = self.move_pattern.get('range', 100)
-            self.rect.x = self.original_pos[0] + math.sin(self.move_timer * speed) * range_val
-        elif self.move_pattern['type'] == 'vertical':
-            speed = self.move_pattern.get('speed', 1.5)
-            range_val = self.move_pattern.get('range', 50)
-            self.rect.y = self.original_pos[1] + math.sin(self.move_timer * speed) * range_val
+        self.rect.y = self.original_pos[1] + math.sin(self.move_timer * self._move_speed) * self._move_range
     
     def get_danger_zone(self):
         """Returns the actual dangerous area (triangle shape)"""
@@ -533,38 +862,55 @@ class Spike(pygame.sprite.Sprite):
         ]
     
     def draw(self, surf, camera_offset):
+        draw_queued(surf, (self,), camera_offset)
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
         draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
+        # Margin covers the warning glow, which reaches up to 24px out
+        if not SCREEN_RECT.colliderect(draw_pos[0] - 24, draw_pos[1] - 24,
+                                       self.rect.width + 48, self.rect.height + 48):
+            return
         
         if self.popup and not self.active:
             # Warning effect
-            intensity = math.sin(self.warn_phase) * 0.5 + 0.5
+            intensity = _SIN_LUT[int(self.warn_phase * _SIN_LUT_SCALE) & _SIN_LUT_MASK] * 0.5 + 0.5
             warn_size = 4 + int(intensity * 8)
-            warn_color = COLOR_SPIKE_WARN
             
             # Warning glow
-            glow_surf = pygame.Surface((self.rect.width + warn_size*2, self.rect.height + warn_size*2), pygame.SRCALPHA)
-            glow_center = (self.rect.width//2 + warn_size, warn_size)
-            pygame.draw.circle(glow_surf, (*warn_color, int(100 * intensity)), glow_center, warn_size*2)
-            surf.blit(glow_surf, (draw_pos[0] - warn_size, draw_pos[1] - warn_size), special_flags=pygame.BLEND_ALPHA_SDL2)
+            glow_surf = get_spike_glow(self.rect.width, self.rect.height, warn_size, int(100 * intensity))
+            underlay.append((glow_surf, (draw_pos[0] - warn_size, draw_pos[1] - warn_size)))
         
         if self.active:
-            # Main spike triangle
-            points = [
-                (draw_pos[0] + self.rect.width//2, draw_pos[1]),
-                (draw_pos[0] + 4, draw_pos[1] + self.rect.height),
-                (draw_pos[0] + self.rect.width - 4, draw_pos[1] + self.rect.height)
-            ]
-            
-            # Shadow
-            shadow_points = [(p[0] + 2, p[1] + 2) for p in points]
-            pygame.draw.polygon(surf, (0, 0, 0, 100), shadow_points)
-            
-            # Main spike
-            pygame.draw.polygon(surf, COLOR_SPIKE, points)
-            # Highlight edge
-            pygame.draw.polygon(surf, (255, 100, 100), points, 2)
+            overlay.append((self.image, draw_pos))
 
 # ---- Enhanced Falling Stone ----
+# Pre-rotated stone and shadow frames keyed by (width, height)
+_STONE_ATLAS_CACHE = {}
+STONE_ROTATION_STEP = 10  # Degrees between atlas frames
+
+def get_stone_atlas(width, height):
+    """Build the stone once and pre-rotate it (plus its shadow) in fixed steps"""
+    key = (width, height)
+    atlas = _STONE_ATLAS_CACHE.get(key)
+    if atlas is None:
+        stone_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(stone_surf, COLOR_PLATFORM, (0, 0, width, height), border_radius=4)
+        
+        # Add some texture
+        pygame.draw.line(stone_surf, COLOR_PLATFORM_EDGE, (5, 5), (width-5, 5), 2)
+        pygame.draw.line(stone_surf, COLOR_PLATFORM_EDGE, (5, height-5), (width-5, height-5), 2)
+        
+        rot_frames = []
+        shadow_frames = []
+        for angle in range(0, 360, STONE_ROTATION_STEP):
+            rotated = pygame.transform.rotate(stone_surf, angle)
+            shadow = rotated.copy()
+            shadow.fill((0, 0, 0, 100), special_flags=pygame.BLEND_RGBA_MULT)
+            rot_frames.append(rotated.convert_alpha())
+            shadow_frames.append(shadow.convert_alpha())
+        atlas = _STONE_ATLAS_CACHE[key] = (rot_frames, shadow_frames)
+    return atlas
+
 class FallingStone(pygame.sprite.Sprite):
     def __init__(self, x, top_y, trigger_range, warning_time=1.0):
         super().__init__()
@@ -576,69 +922,73 @@ class FallingStone(pygame.sprite.Sprite):
         self.dropped = False
         self.settled = False
         self.warning = False
+        self.warning_time = warning_time
         self.warning_timer = warning_time
         self.trigger_range = trigger_range
         self.bounces = 0
         self.max_bounces = 2
+        self.rot_atlas, self.shadow_atlas = get_stone_atlas(self.rect.width, self.rect.height)
     
     def trigger_check(self, player_x):
+        """Start the warning once the player enters range; True on that frame"""
         if not self.dropped and not self.warning:
             if self.trigger_range[0] <= player_x <= self.trigger_range[1]:
                 self.warning = True
+                return True
+        return False
     
-    def update(self, dt, platforms, particles):
-        try:
-            if self.warning and not self.dropped:
-                self.warning_timer -= dt
-                if self.warning_timer <= 0:
-                    self.dropped = True
-                    self.vy = 0
-                    self.angular_velocity = random.uniform(-5, 5)
+    def update(self, dt, platform_rects, particles):
+        if self.settled:
+            return
+        
+        if self.warning and not self.dropped:
+            self.warning_timer -= dt
+            if self.warning_timer <= 0:
+                self.dropped = True
+                self.vy = 0
+                self.angular_velocity = random.uniform(-5, 5)
+        
+        if self.dropped:
+            # Apply gravity
+            self.vy += GRAVITY * 1.5 * dt
+            self.rect.y += int(self.vy)  # Use int for browser compatibility
+            self.rect.x += int(self.vx)  # Use int for browser compatibility
+            
+            # Rotation
+            self.rotation += self.angular_velocity
             
-            if self.dropped and not self.settled:
-                # Apply gravity with safety checks
-                self.vy += GRAVITY * 1.5 * dt
-                self.rect.y += int(self.vy)  # Use int for browser compatibility
-                self.rect.x += int(self.vx)  # Use int for browser compatibility
+            # Check for platform collisions - collidelist scans in C and
+            # only the first platform hit while falling can bounce the stone
+            hit = self.rect.collidelist(platform_rects)
+            if hit != -1 and self.vy > 0:  # Falling down
+                self.rect.bottom = platform_rects[hit].top
+                self.vy = -self.vy * 0.4  # Bounce with damping
+                self.vx *= 0.7  # Friction
+                self.angular_velocity *= 0.7  # Slow rotation
                 
-                # Rotation
-                self.rotation += self.angular_velocity
+                # Add impact particles
+                particles.add_explosion(
+                    (self.rect.centerx, self.rect.bottom),
+                    count=int(abs(self.vy) * 1.5),
+                    color=COLOR_DUST
+                )
                 
-                # Check for platform collisions with error handling
-                for platform in platforms:
-                    try:
-                        if self.rect.colliderect(platform.rect):
-                            if self.vy > 0:  # Falling down
-                                self.rect.bottom = platform.rect.top
-                                self.vy = -self.vy * 0.4  # Bounce with damping
-                                self.vx *= 0.7  # Friction
-                                self.angular_velocity *= 0.7  # Slow rotation
-                                
-                                # Add impact particles with error handling
-                                try:
-                                    particles.add_explosion(
-                                        (self.rect.centerx, self.rect.bottom),
-                                        count=int(abs(self.vy) * 1.5),
-                                        color=COLOR_DUST
-                                    )
-                                except Exception as e:
-                                    print(f"Particle error: {e}")
-                                
-                                self.bounces += 1
-                                if self.bounces >= self.max_bounces or abs(self.vy) < 2:
-                                    self.settled = True
-                                    self.vy = 0
-                                    self.vx = 0
-                                    self.angular_velocity = 0
-                    except Exception as e:
-                        print(f"Platform collision error: {e}")
-        except Exception as e:
-            print(f"FallingStone update error: {e}")
+                self.bounces += 1
+                if self.bounces >= self.max_bounces or abs(self.vy) < 2:
+                    self.settled = True
+                    self.vy = 0
+                    self.vx = 0
+                    self.angular_velocity = 0
     
-    def draw(self, surf, camera_offset):
-        draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
-        
+    def draw(self, surf, camera_offset, ticks):
+        self.draw_warning(surf, camera_offset, ticks)
+        draw_queued(surf, (self,), camera_offset)
+    
+    def draw_warning(self, surf, camera_offset, ticks):
+        """Draw the drop warning, which is line/circle primitives rather than blits"""
         if self.warning and not self.dropped:
+            draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
+            
             # Warning indicator
             warn_progress = 1 - (self.warning_timer / self.warning_time)
             warn_color = (255, int(255 * (1 - warn_progress)), 0, int(200 * warn_progress))
@@ -652,34 +1002,30 @@ class FallingStone(pygame.sprite.Sprite):
             # Warning circle
             pygame.draw.circle(surf, warn_color, 
                              (draw_pos[0] + self.rect.width//2, 20),
-                             10 + int(5 * math.sin(pygame.time.get_ticks() / 100)))
+                             10 + int(5 * _SIN_LUT[int(ticks / 100 * _SIN_LUT_SCALE) & _SIN_LUT_MASK]))
+    
+    def queue_blits(self, camera_offset, underlay, overlay):
+        if not self.dropped:
+            return
+        draw_pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
+        # Margin covers the rotated corners and the shadow offset
+        if not SCREEN_RECT.colliderect(draw_pos[0] - 20, draw_pos[1] - 20,
+                                       self.rect.width + 44, self.rect.height + 44):
+            return
         
-        if self.dropped:
-            # Create a rotated stone surface
-            stone_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(stone_surf, COLOR_PLATFORM, 
-                           (0, 0, self.rect.width, self.rect.height),
-                           border_radius=4)
-            
-            # Add some texture
-            pygame.draw.line(stone_surf, COLOR_PLATFORM_EDGE, 
-                           (5, 5), (self.rect.width-5, 5), 2)
-            pygame.draw.line(stone_surf, COLOR_PLATFORM_EDGE, 
-                           (5, self.rect.height-5), (self.rect.width-5, self.rect.height-5), 2)
-            
-            # Rotate the surface
-            rotated_surf = pygame.transform.rotate(stone_surf, self.rotation)
-            rotated_rect = rotated_surf.get_rect(center=(draw_pos[0] + self.rect.width//2, 
-                                                       draw_pos[1] + self.rect.height//2))
-            
-            # Draw shadow
-            shadow_surf = pygame.transform.rotate(stone_surf, self.rotation)
-            shadow_rect = shadow_surf.get_rect(center=(rotated_rect.centerx + 4, rotated_rect.centery + 4))
-            shadow_surf.fill((0, 0, 0, 100), special_flags=pygame.BLEND_RGBA_MULT)
-            surf.blit(shadow_surf, shadow_rect, special_flags=pygame.BLEND_ALPHA_SDL2)
-            
-            # Draw stone
-            surf.blit(rotated_surf, rotated_rect)
+        # Pick the nearest pre-rotated frame instead of rotating every frame
+        frame = round(self.rotation / STONE_ROTATION_STEP) % len(self.rot_atlas)
+        rotated_surf = self.rot_atlas[frame]
+        rotated_rect = rotated_surf.get_rect(center=(draw_pos[0] + self.rect.width//2, 
+                                                   draw_pos[1] + self.rect.height//2))
+        
+        # Shadow
+        shadow_surf = self.shadow_atlas[frame]
+        shadow_rect = shadow_surf.get_rect(center=(rotated_rect.centerx + 4, rotated_rect.centery + 4))
+        underlay.append((shadow_surf, shadow_rect))
+        
+        # Stone
+        overlay.append((rotated_surf, rotated_rect))
 
 # ---- Enhanced Door ----
 class Door:
@@ -691,6 +1037,31 @@ class Door:
         self.troll_cooldown = 0
         self.active_rect = self.rect1
         self.glow_phase = 0
+        # The open-door glow is drawn once at full alpha; draw() only pulses
+        # its surface alpha
+        self._glow_surf = pygame.Surface((self.rect1.width + 20, self.rect1.height + 20), pygame.SRCALPHA)
+        pygame.draw.rect(self._glow_surf, (*COLOR_DOOR, 255),
+                         (10, 10, self.rect1.width, self.rect1.height), border_radius=12)
+        self._glow_surf = self._glow_surf.convert_alpha()
+        # Both door positions share one size, so one body image per lock state
+        self._body_images = {is_open: self._build_body(is_open) for is_open in (False, True)}
+    
+    def _build_body(self, is_open):
+        """Pre-render the door body, frame and handle for one lock state"""
+        image = pygame.Surface(self.rect1.size, pygame.SRCALPHA)
+        body = image.get_rect()
+        
+        # Main door
+        door_color = COLOR_DOOR if is_open else COLOR_DOOR_LOCKED
+        pygame.draw.rect(image, door_color, body, border_radius=8)
+        
+        # Door frame
+        pygame.draw.rect(image, (door_color[0]+20, door_color[1]+20, door_color[2]+20), 
+                       body, width=2, border_radius=8)
+        
+        # Door handle
+        pygame.draw.circle(image, (200, 200, 200), (body.right - 10, body.centery), 4)
+        return image.convert_alpha()
     
     def set_open(self):
         self.open = True
@@ -728,30 +1099,21 @@ class Door:
             self.active_rect.width,
             self.active_rect.height
         )
+        # Margin covers the shadow and the open-door glow
+        if not SCREEN_RECT.colliderect(draw_rect.inflate(24, 24)):
+            return
         
         # Door shadow
         draw_enhanced_shadow(surf, draw_rect)
         
-        # Main door
-        door_color = COLOR_DOOR if self.open else COLOR_DOOR_LOCKED
-        pygame.draw.rect(surf, door_color, draw_rect, border_radius=8)
-        
-        # Door frame
-        pygame.draw.rect(surf, (door_color[0]+20, door_color[1]+20, door_color[2]+20), 
-                       draw_rect, width=2, border_radius=8)
-        
-        # Door handle
-        handle_x = draw_rect.right - 10
-        handle_y = draw_rect.centery
-        pygame.draw.circle(surf, (200, 200, 200), (handle_x, handle_y), 4)
+        # Door body, frame and handle
+        surf.blit(self._body_images[self.open], draw_rect.topleft)
         
         # Glow effect when open
         if self.open:
-            glow_intensity = (math.sin(self.glow_phase) * 0.5 + 0.5) * 150
-            glow_surf = pygame.Surface((draw_rect.width + 20, draw_rect.height + 20), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*door_color, int(glow_intensity)), 
-                           (10, 10, draw_rect.width, draw_rect.height), border_radius=12)
-            surf.blit(glow_surf, (draw_rect.x - 10, draw_rect.y - 10), special_flags=pygame.BLEND_ALPHA_SDL2)
+            glow_intensity = (_SIN_LUT[int(self.glow_phase * _SIN_LUT_SCALE) & _SIN_LUT_MASK] * 0.5 + 0.5) * 150
+            self._glow_surf.set_alpha(int(glow_intensity))
+            surf.blit(self._glow_surf, (draw_rect.x - 10, draw_rect.y - 10), special_flags=pygame.BLEND_ALPHA_SDL2)
 
 # ---- Enhanced Player ----
 class Player:
@@ -779,12 +1141,17 @@ class Player:
         if self.dead or self.win:
             return
         
+        # Read every key once up front
+        left_held = keys[_K_LEFT] or keys[_K_A]
+        right_held = keys[_K_RIGHT] or keys[_K_D]
+        jump_held = keys[_K_UP] or keys[_K_W] or keys[_K_SPACE]
+        
         # Horizontal movement
         move_x = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if left_held:
             move_x = -1
             self.facing_right = False
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if right_held:
             move_x = 1
             self.facing_right = True
         
@@ -801,28 +1168,29 @@ class Player:
             self.coyote_time -= dt
         
         # Jump input
-        if (keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_SPACE]):
+        if jump_held:
             # Regular jump with coyote time
             if self.on_ground or self.coyote_time > 0:
-                self.vy = JUMP_VELOCITY
+                self._start_jump(JUMP_VELOCITY)
                 self.on_ground = False
                 self.coyote_time = 0
                 self.can_double_jump = True
                 self.has_double_jumped = False
-                self.squash = 0.7
-                self.stretch = 1.3
             # Double jump
             elif self.can_double_jump and not self.has_double_jumped:
-                self.vy = DOUBLE_JUMP_VELOCITY
+                self._start_jump(DOUBLE_JUMP_VELOCITY)
                 self.can_double_jump = False
                 self.has_double_jumped = True
-                self.squash = 0.7
-                self.stretch = 1.3
             else:
                 # Buffer the jump for a short time
                 self.jump_buffer = 0.15
     
-    def physics(self, dt, platforms, particles):
+    def _start_jump(self, velocity):
+        self.vy = velocity
+        self.squash = 0.7
+        self.stretch = 1.3
+    
+    def physics(self, dt, platform_rects, particles):
         if self.dead or self.win:
             return
         
@@ -842,15 +1210,19 @@ class Player:
         if self.vy > TERMINAL_VELOCITY:
             self.vy = TERMINAL_VELOCITY
         
-        # Horizontal movement and collision
+        # Horizontal movement and collision. collidelistall finds the
+        # overlapping platforms in C (plain Rects keep it off the slower
+        # .rect attribute path); only those few are resolved here, each
+        # re-checked because an earlier push-out may already have cleared it
         self.rect.x += self.vx
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
+        for index in self.rect.collidelistall(platform_rects):
+            platform_rect = platform_rects[index]
+            if self.rect.colliderect(platform_rect):
                 if self.vx > 0:
-                    self.rect.right = platform.rect.left
+                    self.rect.right = platform_rect.left
                     self.vx = 0
                 elif self.vx < 0:
-                    self.rect.left = platform.rect.right
+                    self.rect.left = platform_rect.right
                     self.vx = 0
         
         # Vertical movement and collision
@@ -858,21 +1230,20 @@ class Player:
         self.on_ground = False
         
         self.rect.y += self.vy
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
+        for index in self.rect.collidelistall(platform_rects):
+            platform_rect = platform_rects[index]
+            if self.rect.colliderect(platform_rect):
                 if self.vy > 0:  # Landing
-                    self.rect.bottom = platform.rect.top
+                    self.rect.bottom = platform_rect.top
                     self.on_ground = True
                     
                     # Execute buffered jump
                     if self.jump_buffer > 0:
-                        self.vy = JUMP_VELOCITY
+                        self._start_jump(JUMP_VELOCITY)
                         self.on_ground = False
                         self.jump_buffer = 0
                         self.can_double_jump = True
                         self.has_double_jumped = False
-                        self.squash = 0.7
-                        self.stretch = 1.3
                     else:
                         self.vy = 0
                         self.squash = 1.3
@@ -882,16 +1253,25 @@ class Player:
                         if abs(self.vy) > 2:
                             particles.add_dust((self.rect.centerx, self.rect.bottom), count=int(abs(self.vy)/2))
                 elif self.vy < 0:  # Hitting ceiling
-                    self.rect.top = platform.rect.bottom
+                    self.rect.top = platform_rect.bottom
                     self.vy = 0
         
         # Start coyote time when walking off a platform
         if was_on_ground and not self.on_ground:
             self.coyote_time = 0.1
         
-        # Squash and stretch animation
-        self.squash += (1.0 - self.squash) * 0.2
-        self.stretch += (1.0 - self.stretch) * 0.2
+        # Squash and stretch animation. Both snap to rest once within 0.01 of
+        # 1.0, so idle frames skip the easing and draw() skips the rescale
+        if self.squash != 1.0:
+            if abs(self.squash - 1.0) > 0.01:
+                self.squash += (1.0 - self.squash) * 0.2
+            else:
+                self.squash = 1.0
+        if self.stretch != 1.0:
+            if abs(self.stretch - 1.0) > 0.01:
+                self.stretch += (1.0 - self.stretch) * 0.2
+            else:
+                self.stretch = 1.0
         
         # Blink timer
         if self.blink_timer > 0:
@@ -913,7 +1293,7 @@ class Player:
         pygame.draw.rect(normal_surf, (0, 0, 0), (right_eye_x, eye_y, eye_size, eye_size))
         
         # Store the surfaces
-        self.cached_right_surf = normal_surf
+        self.cached_right_surf = normal_surf = normal_surf.convert_alpha()
         
         # Create left-facing surface (flipped)
         self.cached_left_surf = pygame.transform.flip(normal_surf, True, False)
@@ -943,6 +1323,8 @@ class Player:
         pygame.draw.arc(self.cached_win_surf, (0, 0, 0), 
                       (right_eye_x, eye_y, eye_size, eye_size),
                       math.pi, 2*math.pi, 2)
+        self.cached_dead_surf = self.cached_dead_surf.convert_alpha()
+        self.cached_win_surf = self.cached_win_surf.convert_alpha()
         
         # Blink surface
         self.cached_blink_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
@@ -955,11 +1337,19 @@ class Player:
         pygame.draw.line(self.cached_blink_surf, (0, 0, 0), 
                        (right_eye_x, eye_y + eye_size//2), 
                        (right_eye_x + eye_size, eye_y + eye_size//2), 2)
+        self.cached_blink_surf = self.cached_blink_surf.convert_alpha()
         
         # Flipped blink surface
         self.cached_blink_left_surf = pygame.transform.flip(self.cached_blink_surf, True, False)
+        
+        # Squash/stretch frames keyed by (surface, width, height), filled on first use
+        self._scaled_cache = {}
     
     def draw(self, surf, camera_offset):
+        # Randomly blink (reduced probability for better performance)
+        if random.random() < 0.002 and self.blink_timer <= 0:
+            self.blink_timer = 0.1
+        
         # Calculate draw position
         draw_x = self.rect.x + camera_offset[0]
         draw_y = self.rect.y + camera_offset[1]
@@ -971,6 +1361,9 @@ class Player:
         y_offset = (height - self.rect.height)
         
         draw_rect = pygame.Rect(draw_x - x_offset, draw_y - y_offset, width, height)
+        # Margin covers the shadow offset
+        if not SCREEN_RECT.colliderect(draw_rect.inflate(8, 8)):
+            return
         
         # Draw shadow (simplified)
         shadow_rect = pygame.Rect(draw_rect.x + 4, draw_rect.y + 4, draw_rect.width, draw_rect.height)
@@ -986,25 +1379,62 @@ class Player:
         else:
             player_surf = self.cached_left_surf if not self.facing_right else self.cached_right_surf
         
-        # Scale the surface according to squash and stretch
-        scaled_surf = pygame.transform.scale(player_surf, (width, height))
+        # Scale the surface according to squash and stretch. Most frames are at
+        # rest size and need no scaling; the int-sized squash frames repeat, so
+        # each one is scaled once and reused
+        if width == self.rect.width and height == self.rect.height:
+            scaled_surf = player_surf
+        else:
+            key = (player_surf, width, height)
+            scaled_surf = self._scaled_cache.get(key)
+            if scaled_surf is None:
+                scaled_surf = self._scaled_cache[key] = pygame.transform.scale(player_surf, (width, height))
         
         # Draw the player
         surf.blit(scaled_surf, (draw_rect.x, draw_rect.y))
-        
-        # Randomly blink (reduced probability for better performance)
-        if random.random() < 0.002 and self.blink_timer <= 0:
-            self.blink_timer = 0.1
 
 # ---- Game Class ----
 class Game:
+    CONTROLS = (
+        "Move: A/D or ←/→",
+        "Jump: W/↑/Space (Double Jump Available!)",
+        "Reset: R  |  Quit: ESC"
+    )
+    # Fixed debug readout lines, indexed by on_ground and by double-jump state
+    GROUND_LABELS = ("Ground: No", "Ground: Yes")
+    DOUBLE_JUMP_LABELS = ("Double Jump: Available", "Double Jump: Used", "Double Jump: Ready")
+    # (text, font, color) of every HUD string that never changes
+    STATIC_TEXT = (
+        ("ENHANCED DEVILISH PLATFORMER", FONT_BIG, COLOR_FG),
+        ("💀 YOU DIED 💀", FONT_BIG, (255, 100, 100)),
+        ("🎉 VICTORY! 🎉", FONT_BIG, (100, 255, 150)),
+        ("Press R to try again", FONT_BIG, (255, 200, 200)),
+        ("Incredible! Press R to play again", FONT_BIG, (200, 255, 200)),
+        *((control, FONT_SMALL, COLOR_FG) for control in CONTROLS),
+    )
+    
     def __init__(self):
         self.state = GameState.PLAYING
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.death_time = None
         self.win_time = None
+        self._final_timer_text = None  # Set once the run ends
         self.attempts = 1
         self.best_time = float('inf')
+        self._frame_counter = 0  # Drawn frames, for every-other-frame effects
+        self._ticks = pygame.time.get_ticks()  # Sampled once per update()
+        # Rasterize the fixed HUD strings up front so the first frames don't stall
+        for text, font, color in self.STATIC_TEXT:
+            render_text_cached(font, text, color)
+            render_text_cached(font, text, (0, 0, 0, 120))
+        self._controls_overlay, self._controls_pos = self._build_controls_overlay()
+        # Fog bands are rasterised once as opaque white; draw_atmosphere only
+        # changes their surface alpha
+        self._fog_cache = []
+        for _ in range(2):
+            fog_surf = pygame.Surface((WIDTH + 100, 60), pygame.SRCALPHA)
+            pygame.draw.ellipse(fog_surf, (255, 255, 255, 255), fog_surf.get_rect())
+            self._fog_cache.append(fog_surf.convert_alpha())
         
         # Initialize systems
         self.particles = ParticleSystem()
@@ -1015,30 +1445,46 @@ class Game:
     
     def setup_level(self):
         """Create a challenging but completable level with some traps"""
-        self.platforms = []
+        # Stones only ever go warning -> dropped, so once one has warned
+        # the "falling objects" tip is gone for the rest of the run
+        self._any_stone_triggered = False
+        self._tips_state = None  # Forces draw_ui to rebuild the tips
+        self.platforms = CameraGroup()
         
         # Ground and main platforms - wider and more forgiving
-        self.platforms.append(Platform(0, HEIGHT-50, WIDTH, 50))  # Ground
-        self.platforms.append(Platform(120, HEIGHT-160, 220, 20))  # First ledge (wider)
-        self.platforms.append(Platform(400, HEIGHT-240, 180, 20))  # Mid platform (wider)
-        self.platforms.append(Platform(640, HEIGHT-320, 200, 20))  # High platform (wider)
-        self.platforms.append(Platform(900, HEIGHT-200, 220, 20))  # Right platform (wider)
-        self.platforms.append(Platform(1100, HEIGHT-280, 140, 20)) # Final approach (wider)
+        self.platforms.add(Platform(0, HEIGHT-50, WIDTH, 50))  # Ground
+        self.platforms.add(Platform(120, HEIGHT-160, 220, 20))  # First ledge (wider)
+        self.platforms.add(Platform(400, HEIGHT-240, 180, 20))  # Mid platform (wider)
+        self.platforms.add(Platform(640, HEIGHT-320, 200, 20))  # High platform (wider)
+        self.platforms.add(Platform(900, HEIGHT-200, 220, 20))  # Right platform (wider)
+        self.platforms.add(Platform(1100, HEIGHT-280, 140, 20)) # Final approach (wider)
         
         # Additional challenge platforms - more reasonable sizes
-        self.platforms.append(Platform(300, HEIGHT-120, 80, 16))   # Stepping stone (wider)
-        self.platforms.append(Platform(580, HEIGHT-160, 60, 16))   # Gap bridge (wider)
-        self.platforms.append(Platform(820, HEIGHT-240, 70, 16))   # Precision jump (wider)
+        self.platforms.add(Platform(300, HEIGHT-120, 80, 16))   # Stepping stone (wider)
+        self.platforms.add(Platform(580, HEIGHT-160, 60, 16))   # Gap bridge (wider)
+        self.platforms.add(Platform(820, HEIGHT-240, 70, 16))   # Precision jump (wider)
+        
+        # Static platforms never move, so bucket them once for player collision queries
+        self.platform_grid = SpatialGrid()
+        for platform in self.platforms:
+            self.platform_grid.insert(platform.rect)
         
         # Fewer fake platforms with longer delay before disappearing
-        self.fake_platforms = [
+        self.fake_platforms = CameraGroup(
             FakePlatform(220, HEIGHT-200, 60, 16, delay=0.8),  # Early trap (longer delay)
             FakePlatform(750, HEIGHT-260, 50, 16, delay=0.7),  # High-level trap (longer delay)
-        ]
+        )
         
         # Magic wall - now requires multiple hits
         self.magic_wall = MagicWall(350, HEIGHT-140, 70, 80)
         
+        # Rects of solid objects that can stop blocking (fake platforms once
+        # triggered, the wall once destroyed); each removes itself via on_remove
+        blockers = [*self.fake_platforms, self.magic_wall]
+        self.dynamic_rects = [blocker.rect for blocker in blockers]
+        for blocker in blockers:
+            blocker.on_remove = self._remove_blocker
+        
         # Fewer spikes with more reasonable patterns and delays
         self.spikes = [
             Spike(180, HEIGHT-178, w=32, h=26, popup=False),  # Static warning
@@ -1081,139 +1527,118 @@ class Game:
         if self.state != GameState.PLAYING:
             return
         
-        # Use a single try-except block for better performance
-        try:
-            # Early exit flag to avoid unnecessary checks after player death
-            player_killed = False
-            
-            # Wall collision - now requires multiple hits
-            if (not player_killed and self.magic_wall.alive and 
-                self.player.rect.colliderect(self.magic_wall.rect.inflate(5, 5))):
-                
-                if self.magic_wall.hit():  # Wall destroyed
-                    self.particles.add_explosion(
-                        self.magic_wall.rect.center, 
-                        count=10,  # Reduced particle count
-                        color=COLOR_WALL_CRACK
-                    )
-                    self.camera.add_shake(6, 0.4)  # Reduced shake
-                else:  # Wall damaged
-                    self.particles.add_explosion(
-                        (self.player.rect.centerx, self.magic_wall.rect.centery),
-                        count=5,  # Reduced particle count
-                        color=COLOR_WALL_CRACK
-                    )
-                    self.camera.add_shake(3, 0.2)  # Reduced shake
-            
-            # Fake platform collisions
-            if not player_killed:
-                for platform in self.fake_platforms:
-                    if platform.active and not platform.triggered and self.player.rect.colliderect(platform.rect):
-                        if self.player.vy > 0:  # Only trigger when landing on it
-                            platform.trigger()
-                            # Small camera shake as feedback
-                            self.camera.add_shake(1, 0.1)  # Reduced shake
-            
-            # Teleport trap collisions
-            if not player_killed:
-                for trap in self.teleport_traps:
-                    new_pos = trap.check_teleport(self.player.rect, self.particles)
-                    if new_pos:
-                        self.player.rect.x = new_pos[0]
-                        self.player.rect.y = new_pos[1]
-                        self.player.vx = 0
-                        self.player.vy = 0
-                        self.camera.add_shake(3, 0.3)  # Reduced camera effect
-                        break  # Only allow one teleport at a time
-            
-            # Fake door collisions
-            if not player_killed:
-                for door in self.fake_doors:
-                    if door.check_collision(self.player.rect):
-                        self.kill_player()
-                        player_killed = True
-                        break
-            
-            # Spike collisions - simplified collision detection
-            if not player_killed:
-                for spike in self.spikes:
-                    danger_zone = spike.get_danger_zone()
-                    if danger_zone and self.point_in_triangle_collision(self.player.rect, danger_zone):
-                        self.kill_player()
-                        player_killed = True
-                        break
-            
-            # Falling stone collisions - simplified
-            if not player_killed:
-                for stone in self.falling_stones:
-                    if stone.rect.colliderect(self.player.rect):
-                        self.kill_player()
-                        player_killed = True
-                        break
+        # Early exit flag to avoid unnecessary checks after player death
+        player_killed = False
+        
+        # Wall collision - now requires multiple hits
+        if (not player_killed and self.magic_wall.alive and 
+            self.player.rect.colliderect(self.magic_wall.rect.inflate(5, 5))):
             
-            # Door interactions - only if player still alive
-            if not player_killed:
-                self.door.maybe_troll(self.player.rect, self.particles)
+            if self.magic_wall.hit():  # Wall destroyed
+                self.particles.add_explosion(
+                    self.magic_wall.rect.center, 
+                    count=10,  # Reduced particle count
+                    color=COLOR_WALL_CRACK
+                )
+                self.camera.add_shake(6, 0.4)  # Reduced shake
+            else:  # Wall damaged
+                self.particles.add_explosion(
+                    (self.player.rect.centerx, self.magic_wall.rect.centery),
+                    count=5,  # Reduced particle count
+                    color=COLOR_WALL_CRACK
+                )
+                self.camera.add_shake(3, 0.2)  # Reduced shake
+        
+        # Fake platform collisions - collidelistall finds the touched ones in C
+        if not player_killed:
+            fake_platforms = self.fake_platforms.sprites()
+            for index in self.player.rect.collidelistall(fake_platforms):
+                platform = fake_platforms[index]
+                if platform.active and not platform.triggered:
+                    if self.player.vy > 0:  # Only trigger when landing on it
+                        platform.trigger()
+                        # Small camera shake as feedback
+                        self.camera.add_shake(1, 0.1)  # Reduced shake
+        
+        # Teleport trap collisions
+        if not player_killed:
+            for trap in self.teleport_traps:
+                new_pos = trap.check_teleport(self.player.rect, self.particles)
+                if new_pos:
+                    self.player.rect.x = new_pos[0]
+                    self.player.rect.y = new_pos[1]
+                    self.player.vx = 0
+                    self.player.vy = 0
+                    self.camera.add_shake(3, 0.3)  # Reduced camera effect
+                    break  # Only allow one teleport at a time
+        
+        # Fake door collisions
+        if not player_killed:
+            for door in self.fake_doors:
+                if door.check_collision(self.player.rect):
+                    self.kill_player()
+                    player_killed = True
+                    break
+        
+        # Spike collisions - each danger triangle lies inside its spike's rect,
+        # so one C-level pass over the rects (grown by a pixel to keep points
+        # on the edges) leaves only the spikes worth a triangle test
+        if not player_killed:
+            spikes = self.spikes
+            for index in self.player.rect.inflate(2, 2).collidelistall(spikes):
+                danger_zone = spikes[index].get_danger_zone()
+                if danger_zone and self.point_in_triangle_collision(self.player.rect, danger_zone):
+                    self.kill_player()
+                    player_killed = True
+                    break
+        
+        # Falling stone collisions - simplified
+        if not player_killed:
+            if self.player.rect.collidelist(self.falling_stones) != -1:
+                self.kill_player()
+                player_killed = True
+        
+        # Door interactions - only if player still alive
+        if not player_killed:
+            self.door.maybe_troll(self.player.rect, self.particles)
+        
+        # Win condition - check if door is open and proper collision
+        if not player_killed:
+            if self.player.rect.colliderect(self.win_trigger):
+                self.door.set_open()
             
-            # Win condition - check if door is open and proper collision
-            if not player_killed:
-                if self.player.rect.colliderect(self.win_trigger):
-                    self.door.set_open()
-                
-                if self.door.check_win_collision(self.player.rect):
-                    self.win_game()
-                    
-        except Exception as e:
-            # Single exception handler for all collision checks
-            print(f"Collision handling error: {e}")
+            if self.door.check_win_collision(self.player.rect):
+                self.win_game()
     
     def point_in_triangle_collision(self, rect, triangle_points):
-        """Check if rectangle overlaps with triangle - browser-safe implementation"""
-        try:
-            # Simple overlap check - test if any corner of rect is inside triangle
-            corners = [
-                (rect.left, rect.top), (rect.right, rect.top),
-                (rect.left, rect.bottom), (rect.right, rect.bottom),
-                (rect.centerx, rect.centery)  # Also check center
-            ]
-            
-            for corner in corners:
-                if self.point_in_triangle(corner, triangle_points):
-                    return True
+        """Check if rectangle overlaps with triangle (three (x, y) points, as from get_danger_zone)"""
+        # Barycentric test with the per-triangle terms computed once and
+        # shared by all five points
+        (x1, y1), (x2, y2), (x3, y3) = triangle_points
+        dy23 = y2 - y3
+        dx32 = x3 - x2
+        dy31 = y3 - y1
+        dx13 = x1 - x3
+        denominator = dy23 * dx13 + dx32 * (y1 - y3)
+        if abs(denominator) < 0.001:
             return False
-        except Exception as e:
-            print(f"Triangle collision error: {e}")
-            return False  # Safer to return false on error
-    
-    def point_in_triangle(self, point, triangle):
-        """Check if point is inside triangle using barycentric coordinates - with safety checks"""
-        try:
-            # Validate inputs to prevent browser crashes
-            if not point or not triangle or len(triangle) != 3:
-                return False
-                
-            x, y = point
-            x1, y1 = triangle[0]
-            x2, y2 = triangle[1]
-            x3, y3 = triangle[2]
-            
-            denominator = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3)
-            if abs(denominator) < 0.001:
-                return False
-            
-            a = ((y2 - y3) * (x - x3) + (x3 - x2) * (y - y3)) / denominator
-            b = ((y3 - y1) * (x - x3) + (x1 - x3) * (y - y3)) / denominator
-            c = 1 - a - b
-            
-            return a >= 0 and b >= 0 and c >= 0
-        except Exception as e:
-            print(f"Point in triangle calculation error: {e}")
-            return False  # Safer to return false on error
+        
+        # Simple overlap check - test if any corner of rect is inside triangle
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        center_x, center_y = rect.center  # Also check center
+        for x, y in ((left, top), (right, top), (left, bottom), (right, bottom),
+                     (center_x, center_y)):
+            a = (dy23 * (x - x3) + dx32 * (y - y3)) / denominator
+            b = (dy31 * (x - x3) + dx13 * (y - y3)) / denominator
+            if a >= 0 and b >= 0 and 1 - a - b >= 0:
+                return True
+        return False
     
     def kill_player(self):
         self.state = GameState.DEAD
         self.player.dead = True
-        self.death_time = time.time()
+        self.death_time = time.monotonic()
+        self._final_timer_text = self._format_timer(self.death_time)
         self.attempts += 1
         
         # Death particles
@@ -1228,7 +1653,8 @@ class Game:
     def win_game(self):
         self.state = GameState.WON
         self.player.win = True
-        self.win_time = time.time()
+        self.win_time = time.monotonic()
+        self._final_timer_text = self._format_timer(self.win_time)
         
         current_time = self.win_time - self.start_time
         if current_time < self.best_time:
@@ -1243,11 +1669,15 @@ class Game:
         )
         self.camera.add_shake(6, 0.5)
     
+    def _format_timer(self, now):
+        return f"Time: {now - self.start_time:.2f}s"
+    
     def reset_game(self):
         self.state = GameState.PLAYING
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.death_time = None
         self.win_time = None
+        self._final_timer_text = None
         self.setup_level()
         self.particles = ParticleSystem()
         self.camera = Camera()
@@ -1261,6 +1691,8 @@ class Game:
         if keys[pygame.K_ESCAPE]:
             return False  # Quit game
         
+        self._ticks = pygame.time.get_ticks()
+        
         # Update game objects
         if self.state == GameState.PLAYING:
             self.player.control(keys, dt)
@@ -1269,68 +1701,50 @@ class Game:
         player_x = self.player.rect.centerx
         player_y = self.player.rect.centery
         
+        # Objects within 800 pixels of the player, found in one C-level pass per list
+        near_fake_platforms = self._near_player(self.fake_platforms.sprites(), 800)
+        
         # Update fake platforms - only if they're visible
-        try:
-            for platform in self.fake_platforms:
-                # Only update platforms within 800 pixels of player
-                if abs(platform.rect.centerx - player_x) < 800:
-                    platform.update(dt)
-        except Exception as e:
-            print(f"Fake platform update error: {e}")
+        for platform in near_fake_platforms:
+            platform.update(dt)
         
         # Update teleport traps - only if they're visible
-        try:
-            for trap in self.teleport_traps:
-                # Only update traps within 800 pixels of player
-                if abs(trap.rect.centerx - player_x) < 800:
-                    trap.update(dt)
-        except Exception as e:
-            print(f"Teleport trap update error: {e}")
+        for trap in self._near_player(self.teleport_traps, 800):
+            trap.update(dt)
         
         # Update fake doors - only if they're visible
-        try:
-            for door in self.fake_doors:
-                # Only update doors within 800 pixels of player
-                if abs(door.rect.centerx - player_x) < 800:
-                    door.update(dt)
-        except Exception as e:
-            print(f"Fake door update error: {e}")
-        
-        # Physics for all objects - optimize platform collision list
-        # Only include platforms that are near the player
-        platforms_for_collision = [p for p in self.platforms if abs(p.rect.centerx - player_x) < 800]
-        
-        # Add active fake platforms to collision list - only if they're near the player
-        try:
-            for fake in self.fake_platforms:
-                if fake.active and not fake.triggered and abs(fake.rect.centerx - player_x) < 800:
-                    platforms_for_collision.append(Platform(fake.rect.x, fake.rect.y,
-                                                          fake.rect.width, fake.rect.height))
-        except Exception as e:
-            print(f"Fake platform collision setup error: {e}")
-            
-        # Only add magic wall if it's alive and near the player
-        if self.magic_wall.alive and abs(self.magic_wall.rect.centerx - player_x) < 800:
-            platforms_for_collision.append(Platform(self.magic_wall.rect.x, self.magic_wall.rect.y,
-                                                   self.magic_wall.rect.width, self.magic_wall.rect.height))
-        
-        # Physics update with optimized platform list
-        self.player.physics(dt, platforms_for_collision, self.particles)
+        for door in self._near_player(self.fake_doors, 800):
+            door.update(dt)
+        
+        # Active fake platforms and the wall collide by their own rects
+        dynamic_rects = self.dynamic_rects
+        
+        # Physics update: the player only needs the static platforms in grid
+        # cells it can reach this frame (one step is at most TERMINAL_VELOCITY)
+        # query() hands back a fresh list, so the blockers are appended to it
+        # in place rather than concatenated into yet another list
+        reach = self.player.rect.inflate(PLAYER_QUERY_MARGIN * 2, PLAYER_QUERY_MARGIN * 2)
+        nearby_rects = self.platform_grid.query(reach)
+        nearby_rects += dynamic_rects
+        self.player.physics(dt, nearby_rects, self.particles)
+        
+        # Stones can fall anywhere near the player, so they get the wider list;
+        # the grid already holds the static rects, so nothing is rebuilt per frame
+        platforms_for_collision = self._near_player(self.platform_grid.rects, 800)
+        platforms_for_collision += dynamic_rects
         
         # Update other objects - only if they're visible
-        for spike in self.spikes:
-            # Only update spikes within 800 pixels of player
-            if abs(spike.rect.centerx - player_x) < 800:
-                spike.update(dt)
+        for spike in self._near_player(self.spikes, 800):
+            spike.update(dt)
         
-        for stone in self.falling_stones:
-            # Only check and update stones within 1000 pixels of player
-            if abs(stone.rect.centerx - player_x) < 1000:
-                stone.trigger_check(player_x)
-                stone.update(dt, platforms_for_collision, self.particles)  # Use optimized platform list
+        # Only check and update stones within 1000 pixels of player
+        for stone in self._near_player(self.falling_stones, 1000):
+            if stone.trigger_check(player_x):
+                self._any_stone_triggered = True
+            stone.update(dt, platforms_for_collision, self.particles)  # Use optimized platform list
         
         # Only update magic wall if it's near the player
-        if abs(self.magic_wall.rect.centerx - player_x) < 800:
+        if abs(self.magic_wall.cx - player_x) < 800:
             self.magic_wall.update(dt)
             
         # Always update the door as it's important for game progression
@@ -1348,6 +1762,20 @@ class Game:
         
         return True
     
+    def _remove_blocker(self, blocker):
+        """on_remove callback: drop a fake platform or the wall from collisions"""
+        for index, rect in enumerate(self.dynamic_rects):
+            if rect is blocker.rect:
+                del self.dynamic_rects[index]
+                return
+    
+    def _near_player(self, objects, reach):
+        """Return the objects (or plain Rects) within `reach` pixels of the player horizontally"""
+        # A full-height band around the player lets collidelistall do the test in C
+        band = pygame.Rect(self.player.rect.centerx - reach, -NEAR_BAND_EXTENT,
+                           reach * 2, NEAR_BAND_EXTENT * 2)
+        return [objects[index] for index in band.collidelistall(objects)]
+    
     def draw(self, surf):
         # Clear screen
         surf.fill((0, 0, 0))
@@ -1356,91 +1784,48 @@ class Game:
         draw_vertical_gradient(surf, COLOR_BG_TOP, COLOR_BG_BOTTOM)
         
         # Atmospheric effects - only draw every other frame
-        if pygame.time.get_ticks() % 2 == 0:
+        self._frame_counter += 1
+        if self._frame_counter & 1:
             self.draw_atmosphere(surf)
         
         # Get camera offset once
         camera_offset = self.camera.get_offset()
         
-        # Get player position for culling
-        player_x = self.player.rect.centerx
-        player_y = self.player.rect.centery
-        
-        # Calculate visible area with some margin
-        visible_left = player_x - WIDTH//2 - 100 - camera_offset[0]
-        visible_right = player_x + WIDTH//2 + 100 - camera_offset[0]
-        visible_top = player_y - HEIGHT//2 - 100 - camera_offset[1]
-        visible_bottom = player_y + HEIGHT//2 + 100 - camera_offset[1]
+        # Visible world area with some margin. It follows the camera, not the
+        # player: the camera is clamped, so the player is often off-centre
+        view_rect = pygame.Rect(-camera_offset[0] - 100, -camera_offset[1] - 100,
+                                WIDTH + 200, HEIGHT + 200)
         
-        # Draw game objects - only if they're visible
-        for platform in self.platforms:
-            # Only draw platforms that are potentially visible
-            if (platform.rect.right > visible_left and 
-                platform.rect.left < visible_right and
-                platform.rect.bottom > visible_top and
-                platform.rect.top < visible_bottom):
-                platform.draw(surf, camera_offset)
-            
-        # Draw fake platforms - only if they're visible
-        try:
-            for platform in self.fake_platforms:
-                # Only draw platforms that are potentially visible
-                if (platform.rect.right > visible_left and 
-                    platform.rect.left < visible_right and
-                    platform.rect.bottom > visible_top and
-                    platform.rect.top < visible_bottom):
-                    platform.draw(surf, camera_offset)
-        except Exception as e:
-            print(f"Fake platform draw error: {e}")
+        # Draw platforms and fake platforms - only the ones overlapping the view
+        self.platforms.draw(surf, camera_offset, view_rect)
+        self.fake_platforms.draw(surf, camera_offset, view_rect)
         
         # Draw teleport traps - only if they're visible
-        try:
-            for trap in self.teleport_traps:
-                # Only draw traps that are potentially visible
-                if (trap.rect.right > visible_left and 
-                    trap.rect.left < visible_right and
-                    trap.rect.bottom > visible_top and
-                    trap.rect.top < visible_bottom):
-                    trap.draw(surf, camera_offset)
-        except Exception as e:
-            print(f"Teleport trap draw error: {e}")
+        traps = self.teleport_traps
+        draw_queued(surf, [traps[i] for i in view_rect.collidelistall(traps)], camera_offset)
         
         # Draw magic wall - only if it's visible
-        if (self.magic_wall.rect.right > visible_left and 
-            self.magic_wall.rect.left < visible_right and
-            self.magic_wall.rect.bottom > visible_top and
-            self.magic_wall.rect.top < visible_bottom):
+        if view_rect.colliderect(self.magic_wall.rect):
             self.magic_wall.draw(surf, camera_offset)
         
         # Draw spikes - only if they're visible
-        for spike in self.spikes:
-            if (spike.rect.right > visible_left and 
-                spike.rect.left < visible_right and
-                spike.rect.bottom > visible_top and
-                spike.rect.top < visible_bottom):
-                spike.draw(surf, camera_offset)
-        
-        # Draw falling stones - only if they're visible
-        for stone in self.falling_stones:
-            if (stone.rect.right > visible_left and 
-                stone.rect.left < visible_right and
-                stone.rect.bottom > visible_top and
-                stone.rect.top < visible_bottom):
-                stone.draw(surf, camera_offset)
+        spikes = self.spikes
+        draw_queued(surf, [spikes[i] for i in view_rect.collidelistall(spikes)], camera_offset)
+        
+        # Draw falling stones - only if they're visible. Warnings are drawn
+        # first, then every dropped stone's shadow and sprite in two fblits
+        stones = self.falling_stones
+        visible_stones = [stones[i] for i in view_rect.collidelistall(stones)]
+        for stone in visible_stones:
+            stone.draw_warning(surf, camera_offset, self._ticks)
+        draw_queued(surf, visible_stones, camera_offset)
         
         # Always draw the door as it's important for game progression
         self.door.draw(surf, camera_offset)
         
         # Draw fake doors - only if they're visible
-        try:
-            for door in self.fake_doors:
-                if (door.rect.right > visible_left and 
-                    door.rect.left < visible_right and
-                    door.rect.bottom > visible_top and
-                    door.rect.top < visible_bottom):
-                    door.draw(surf, camera_offset)
-        except Exception as e:
-            print(f"Fake door draw error: {e}")
+        doors = self.fake_doors
+        draw_queued(surf, [doors[i] for i in view_rect.collidelistall(doors)], camera_offset)
             
         # Always draw the player
         self.player.draw(surf, camera_offset)
@@ -1452,30 +1837,57 @@ class Game:
         self.draw_ui(surf)
     
     def draw_atmosphere(self, surf):
-        """Draw atmospheric effects - optimized version"""
-        # Only update atmosphere every other frame to reduce CPU usage
-        if pygame.time.get_ticks() % 2 == 0:
-            return
-            
-        t = pygame.time.get_ticks() / 1000.0
+        """Draw atmospheric effects; Game.draw calls this every other frame"""
+        t = self._ticks / 1000.0
+        blit = surf.blit
+        
+        # Purely decorative motion, so the shared sine table is accurate enough
+        lut = _SIN_LUT
+        scale = _SIN_LUT_SCALE
+        mask = _SIN_LUT_MASK
         
         # Reduced fog layers (2 instead of 4)
-        for i in range(2):
-            y = int(100 + i * 120 + math.sin(t * 0.3 + i) * 20)
-            alpha = 30 + int(20 * math.sin(t * 0.5 + i))
+        drift_phase = t * 0.3
+        pulse_phase = t * 0.5
+        for i, fog_surf in enumerate(self._fog_cache):
+            y = int(100 + i * 120 + lut[int((drift_phase + i) * scale) & mask] * 20)
+            alpha = 30 + int(20 * lut[int((pulse_phase + i) * scale) & mask])
             
-            # Use a smaller fog surface
-            fog_surf = pygame.Surface((WIDTH + 100, 60), pygame.SRCALPHA)
-            pygame.draw.ellipse(fog_surf, (255, 255, 255, alpha), (0, 0, WIDTH + 100, 60))
-            surf.blit(fog_surf, (-50 + i * 30, y), special_flags=pygame.BLEND_ALPHA_SDL2)
+            fog_surf.set_alpha(alpha)
+            blit(fog_surf, (-50 + i * 30, y), special_flags=pygame.BLEND_ALPHA_SDL2)
         
-        # Reduced parallax elements (3 instead of 6)
+        # Reduced parallax elements (3 instead of 6). The star moves every
+        # frame, so only the dot itself is cached, one sprite per grey level
+        sway_phase = t * 0.1
         for i in range(3):
-            star_x = int((i * 200 + math.sin(t * 0.1 + i) * 30) % WIDTH)
+            star_x = int((i * 200 + lut[int((sway_phase + i) * scale) & mask] * 30) % WIDTH)
             star_y = int(50 + i * 60)
-            brightness = int(100 + 50 * math.sin(t + i))
-            pygame.draw.circle(surf, (brightness, brightness, brightness), 
-                             (star_x, star_y), 2)
+            brightness = int(100 + 50 * lut[int((t + i) * scale) & mask])
+            blit(get_star_sprite(brightness),
+                 (star_x - STAR_RADIUS - 1, star_y - STAR_RADIUS - 1))
+    
+    def _build_controls_overlay(self):
+        """Compose the control hints and their shadows into one surface"""
+        positions = [(WIDTH // 2, HEIGHT - 100 + i * 25) for i in range(len(self.CONTROLS))]
+        # Union of every line and its 2px shadow, in screen space
+        bounds = None
+        for control, pos in zip(self.CONTROLS, positions):
+            line_rect = render_text_cached(FONT_SMALL, control, COLOR_FG).get_rect(center=pos)
+            line_rect.width += 2
+            line_rect.height += 2
+            bounds = line_rect if bounds is None else bounds.union(line_rect)
+        
+        # Layer in premultiplied alpha: plain alpha blits onto a transparent
+        # surface would darken the antialiased edges where text meets shadow
+        overlay = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for control, (x, y) in zip(self.CONTROLS, positions):
+            text_surf = render_text_cached(FONT_SMALL, control, COLOR_FG)
+            shadow_surf = render_text_cached(FONT_SMALL, control, (0, 0, 0, 120))
+            text_rect = text_surf.get_rect(center=(x - bounds.x, y - bounds.y))
+            overlay.blit(shadow_surf.premul_alpha(), (text_rect.x + 2, text_rect.y + 2),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+            overlay.blit(text_surf.premul_alpha(), text_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+        return overlay.convert_alpha(), bounds.topleft
     
     def draw_ui(self, surf):
         """Enhanced UI with better information display"""
@@ -1494,15 +1906,11 @@ class Game:
         
         draw_text(surf, title_text, (WIDTH // 2, 40), FONT_BIG, title_color)
         
-        # Timer
-        current_time = time.time() - self.start_time
-        if self.state == GameState.DEAD and self.death_time:
-            current_time = self.death_time - self.start_time
-        elif self.state == GameState.WON and self.win_time:
-            current_time = self.win_time - self.start_time
-        
-        timer_text = f"Time: {current_time:.2f}s"
-        draw_text(surf, timer_text, (WIDTH - 100, 30), FONT, align='right')
+        # Timer; frozen after death or victory, so formatted once at that point
+        timer_text = self._final_timer_text
+        if timer_text is None:
+            timer_text = self._format_timer(time.monotonic())
+        draw_text(surf, timer_text, (WIDTH - 100, 30), FONT, align='right', slot='timer')
         
         # Attempts counter
         attempts_text = f"Attempts: {self.attempts}"
@@ -1513,15 +1921,8 @@ class Game:
             best_text = f"Best: {self.best_time:.2f}s"
             draw_text(surf, best_text, (WIDTH - 100, 90), FONT, align='right')
         
-        # Controls
-        controls = [
-            "Move: A/D or ←/→",
-            "Jump: W/↑/Space (Double Jump Available!)",
-            "Reset: R  |  Quit: ESC"
-        ]
-        
-        for i, control in enumerate(controls):
-            draw_text(surf, control, (WIDTH // 2, HEIGHT - 100 + i * 25), FONT_SMALL)
+        # Controls, composed once into a single overlay
+        surf.blit(self._controls_overlay, self._controls_pos, special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Game state messages
         if self.state == GameState.DEAD:
@@ -1529,19 +1930,25 @@ class Game:
         elif self.state == GameState.WON:
             draw_text(surf, "Incredible! Press R to play again", (WIDTH // 2, HEIGHT // 2), FONT_BIG, (200, 255, 200))
         elif self.state == GameState.PLAYING:
-            # Gameplay tips
-            tips = []
-            if not self.door.trolled_once:
-                tips.append("That door looks suspicious... 🤔")
-            if self.magic_wall.alive:
-                if self.magic_wall.cracked:
-                    tips.append("The wall is cracking! Hit it again! 💥")
-                else:
-                    tips.append("Try breaking through that wall... 🧱")
-            if not any(stone.warning or stone.dropped for stone in self.falling_stones):
-                tips.append("Watch out for falling objects! ⚠")
+            # Gameplay tips; the list only changes when the door, wall or
+            # stones change state, so it is rebuilt only then
+            tips_state = (self.door.trolled_once, self.magic_wall.alive,
+                          self.magic_wall.cracked, self._any_stone_triggered)
+            if tips_state != self._tips_state:
+                self._tips_state = tips_state
+                tips = []
+                if not self.door.trolled_once:
+                    tips.append("That door looks suspicious... 🤔")
+                if self.magic_wall.alive:
+                    if self.magic_wall.cracked:
+                        tips.append("The wall is cracking! Hit it again! 💥")
+                    else:
+                        tips.append("Try breaking through that wall... 🧱")
+                if not self._any_stone_triggered:
+                    tips.append("Watch out for falling objects! ⚠")
+                self._tips = tips[:2]  # Show max 2 tips
             
-            for i, tip in enumerate(tips[:2]):  # Show max 2 tips
+            for i, tip in enumerate(self._tips):
                 draw_text(surf, tip, (WIDTH // 2, 100 + i * 30), FONT_SMALL, (200, 200, 255))
         
         # Player info (debug-style info)
@@ -1549,25 +1956,36 @@ class Game:
             player_info = [
                 f"Pos: ({self.player.rect.x}, {self.player.rect.y})",
                 f"Vel: ({self.player.vx:.1f}, {self.player.vy:.1f})",
-                f"Ground: {'Yes' if self.player.on_ground else 'No'}",
-                f"Double Jump: {'Available' if self.player.can_double_jump else 'Used' if self.player.has_double_jumped else 'Ready'}"
+                self.GROUND_LABELS[self.player.on_ground],
+                self.DOUBLE_JUMP_LABELS[0 if self.player.can_double_jump else
+                                        1 if self.player.has_double_jumped else 2]
             ]
             
             for i, info in enumerate(player_info):
                 draw_text(surf, info, (100, HEIGHT - 120 + i * 20), FONT_SMALL, 
-                         (150, 150, 150), align='left', shadow=False)
+                         (150, 150, 150), align='left', shadow=False, slot=('player_info', i))
 
 # ---- Main Game Loop ----
+# Game.draw repaints the whole screen every frame (gradient, drifting fog,
+# HUD timer), so a dirty-rect display.update would miss changed pixels or
+# cover more than the ~25% of the screen beyond which flip is faster anyway
+def present_frame():
+    """Push the finished frame to the display with one full flip"""
+    pygame.display.flip()
+
 async def main():
     game = Game()
     running = True
-    last_time = time.time()
+    frame_time = 1.0 / FPS
+    # Monotonic clock so wall-clock adjustments can't stall or rush the loop
+    last_time = time.monotonic()
+    next_frame = last_time + frame_time
     
     while running:
         try:
             # Calculate delta time with a safety cap to prevent large jumps
-            current_time = time.time()
-            dt = min(clock.tick(FPS) / 1000.0, 0.1)  # Cap at 100ms to prevent physics issues
+            current_time = time.monotonic()
+            dt = min(current_time - last_time, 0.1)  # Cap at 100ms to prevent physics issues
             last_time = current_time
             
             # Handle events
@@ -1588,12 +2006,20 @@ async def main():
             # Draw everything with error handling
             try:
                 game.draw(screen)
-                pygame.display.flip()
+                present_frame()
             except Exception as e:
                 print(f"Game draw error: {e}")
             
-            # Give control back to browser - essential for web version
-            await asyncio.sleep(0)
+            # Sleep until the next frame deadline, giving control back to the
+            # browser/event loop. Deadlines advance by a fixed step so timing
+            # error doesn't accumulate; after a long stall, resync instead of
+            # bursting through missed frames.
+            next_frame += frame_time
+            delay = next_frame - time.monotonic()
+            if delay < -frame_time:
+                next_frame = time.monotonic()
+                delay = 0
+            await asyncio.sleep(max(0.0, delay))
         except Exception as e:
             print(f"Main loop error: {e}")
             # Don't exit on error, try to continue